@@ -29,6 +29,6 @@ setup(
             "mv-reviewer=video_analyzer.cli_review:main",
         ],
     },
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     include_package_data=True
 )
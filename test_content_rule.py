@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for content frame extraction and reuse (no LLM service)."""
+import cv2
+import numpy as np
+
+from video_analyzer.mv_reviewer import MVReviewer
+from video_analyzer.mv_reviewer import reviewer as reviewer_module
+from video_analyzer.mv_reviewer.rules.content_rule import ContentRule
+
+
+class FakeLLMClient:
+    """Answers every frame with an empty violation list."""
+
+    def __init__(self):
+        self.frames = []
+
+    def generate(self, prompt, image_path=None, **kwargs):
+        self.frames.append(image_path)
+        return {'response': '{"violations": []}'}
+
+
+def _write_video(path, frames=30):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), 10, (64, 48))
+    for i in range(frames):
+        writer.write(np.full((48, 64, 3), i * 8, dtype=np.uint8))
+    writer.release()
+
+
+def test_frames_persist_across_reviews(tmp_path, monkeypatch):
+    """A second review of an unchanged video reuses the cached frames."""
+    monkeypatch.setattr(reviewer_module, 'ensure_probed', lambda context: True)
+    monkeypatch.setattr(ContentRule, 'DEFAULT_FRAME_CACHE_DIR', tmp_path / 'frames')
+    video = tmp_path / 'song.mp4'
+    _write_video(video)
+
+    opened = []
+    video_capture = cv2.VideoCapture
+
+    def counting_capture(*args):
+        opened.append(args)
+        return video_capture(*args)
+    monkeypatch.setattr(cv2, 'VideoCapture', counting_capture)
+
+    client = FakeLLMClient()
+    reviewer = MVReviewer(llm_client=client, enabled_rules=[4], temp_root=tmp_path)
+
+    first = reviewer.review(video)
+    second = reviewer.review(video)
+
+    assert not first.is_violation and not second.is_violation
+    assert len(opened) == 1
+    # Both reviews sent the same frame files
+    assert client.frames and len(set(client.frames)) == len(client.frames) // 2
+    assert all(frame.startswith(str(tmp_path / 'frames')) for frame in client.frames)
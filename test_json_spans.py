@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Tests for extracting JSON values from LLM responses."""
+import json
+
+import pytest
+
+from video_analyzer.mv_reviewer.services.json_spans import iter_json_spans, load_first_json
+
+
+def test_spans_are_top_level_and_in_order():
+    """Nested brackets stay inside their span; separate values split."""
+    text = 'Result: {"a": {"b": [1, 2]}} Note: {"c": 3} trailing }'
+
+    assert list(iter_json_spans(text, '{', '}')) == ['{"a": {"b": [1, 2]}}', '{"c": 3}']
+
+
+def test_brackets_inside_strings_are_ignored():
+    """Brackets and escaped quotes inside JSON strings don't end a span."""
+    text = 'x {"reason": "has } and \\" {", "ok": true} y'
+
+    assert list(iter_json_spans(text, '{', '}')) == ['{"reason": "has } and \\" {", "ok": true}']
+
+
+def test_quotes_outside_spans_are_ignored():
+    """Quotes in the prose around the JSON don't start a string."""
+    text = 'He said "look: [1]" then [2, 3]'
+
+    assert list(iter_json_spans(text, '[', ']')) == ['[1]', '[2, 3]']
+
+
+def test_unbalanced_span_yields_nothing():
+    """A truncated response yields no span."""
+    assert list(iter_json_spans('{"a": [1, 2', '{', '}')) == []
+
+
+def test_load_first_json_skips_invalid_spans():
+    """The first span that parses wins; invalid ones before it are skipped."""
+    text = 'Example: {not json} Answer: {"violation": false}'
+
+    assert load_first_json(text, '{', '}') == {'violation': False}
+    assert load_first_json('[{"frame": 1}]', '[', ']') == [{'frame': 1}]
+
+
+def test_load_first_json_without_spans():
+    """No span at all returns None; only invalid spans raise."""
+    assert load_first_json('no json here', '{', '}') is None
+    with pytest.raises(json.JSONDecodeError):
+        load_first_json('{oops}', '{', '}')
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Tests for HTTP session handling of the LLM clients."""
+import threading
+
+from video_analyzer.clients.generic_openai_api import GenericOpenAIAPIClient
+from video_analyzer.clients.ollama import OllamaClient
+
+
+def test_sessions_are_per_thread():
+    """Each thread reuses its own session; threads never share one."""
+    for client in (OllamaClient(), GenericOpenAIAPIClient('key', 'http://localhost/v1')):
+        assert client.session is client.session
+
+        barrier = threading.Barrier(2)
+        sessions = []
+
+        def use_session():
+            barrier.wait()  # both threads are alive at the same time
+            sessions.append(client.session)
+
+        threads = [threading.Thread(target=use_session) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sessions[0] is not sessions[1]
+        assert client.session not in sessions
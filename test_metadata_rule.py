@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the blocked-creator rule with stubbed Shazam and MusicBrainz."""
+import numpy as np
+
+from video_analyzer.mv_reviewer.models.review_result import ReviewContext, SongMetadata
+from video_analyzer.mv_reviewer.rules.metadata_rule import MetadataRule
+
+
+class FakeShazam:
+    def __init__(self):
+        self.calls = []
+
+    def identify_samples(self, samples, sample_rate, temp_dir):
+        self.calls.append(sample_rate)
+        return {'title': '红豆', 'artist': '王菲'}
+
+    def identify_from_video(self, video_path, temp_dir):
+        raise AssertionError("decoded samples should be reused")
+
+
+class FakeMusicBrainz:
+    def get_song_metadata(self, title, artist):
+        return {
+            'title': title,
+            'artist': artist,
+            'lyricist': ['林夕'],
+            'composer': ['柳重言'],
+        }
+
+
+def _rule(cache_dir, blocked_creators=('林夕',)):
+    rule = MetadataRule({'cache_dir': cache_dir, 'blocked_creators': list(blocked_creators)})
+    rule.shazam_client = FakeShazam()
+    rule.musicbrainz_client = FakeMusicBrainz()
+    return rule
+
+
+def _context(video):
+    return ReviewContext(
+        video_path=video,
+        audio_samples=np.ones(16000, dtype=np.int16),
+        audio_sample_rate=16000,
+    )
+
+
+def _check(tmp_path, blocked_creators, **metadata):
+    context = ReviewContext(video_path=tmp_path / 'song.mp4')
+    context.song_metadata = SongMetadata(title='红豆', artist='王菲', **metadata)
+    return _rule(None, blocked_creators).check(context)
+
+
+def test_blocked_creator_roles(tmp_path):
+    """Blocked names match inside creator strings, case-insensitively."""
+    violation = _check(
+        tmp_path, ['Chan', '林夕'],
+        lyricist=['林夕 / 陈辉阳'], composer=['Eason CHAN']
+    )
+
+    assert violation.details['blocked_creator'] == 'Chan'
+    assert violation.details['matched_roles'] == ['作曲']
+
+
+def test_unlisted_creators_pass(tmp_path):
+    """Songs without blocked (or any) creators are not flagged."""
+    assert _check(tmp_path, ['林夕'], lyricist=['黄伟文'], composer=['陈辉阳']) is None
+    assert _check(tmp_path, ['林夕']) is None
+    assert _check(tmp_path, [], lyricist=['林夕']) is None
+
+
+def test_blocked_lyricist_is_reported(tmp_path):
+    """A blocked lyricist is flagged using the already decoded audio."""
+    video = tmp_path / 'song.mp4'
+    video.write_bytes(b'video')
+    rule = _rule(tmp_path / 'cache')
+
+    context = _context(video)
+    violation = rule.check(context)
+
+    assert violation is not None
+    assert violation.details['blocked_creator'] == '林夕'
+    assert violation.details['matched_roles'] == ['作词']
+    assert context.song_metadata.composer == ['柳重言']
+    assert rule.shazam_client.calls == [16000]
+
+
+def test_identification_is_cached_by_content(tmp_path):
+    """A renamed copy of a video reuses the cached Shazam result."""
+    video = tmp_path / 'song.mp4'
+    video.write_bytes(b'video')
+    _rule(tmp_path / 'cache').check(_context(video))
+
+    moved = tmp_path / 'violations' / 'renamed.mp4'
+    moved.parent.mkdir()
+    video.rename(moved)
+    rule = _rule(tmp_path / 'cache')
+
+    assert rule.check(_context(moved)) is not None
+    assert rule.shazam_client.calls == []
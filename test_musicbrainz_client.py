@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Tests for MusicBrainz credit lookups, caching and work sharing (no network)."""
+import threading
+import time
+
+import pytest
+import requests
+
+from video_analyzer.mv_reviewer.services import musicbrainz_client
+from video_analyzer.mv_reviewer.services.musicbrainz_client import MusicBrainzClient
+from video_analyzer.mv_reviewer.services.rate_limit import RequestGate, SharedLookups
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+class FakeSession:
+    """Stands in for requests.Session; routes are WS/2 paths."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params, timeout):
+        path = url[len(musicbrainz_client.API_URL) + 1:]
+        with self._lock:
+            self.calls.append(path)
+        route = self.routes[path]
+        return route() if callable(route) else route
+
+
+def _work(*credits):
+    return FakeResponse(200, {'relations': [
+        {'type': role, 'artist': {'name': name}} for role, name in credits
+    ]})
+
+
+def _recording(*work_ids):
+    return FakeResponse(200, {'relations': [{'work': {'id': w}} for w in work_ids]})
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(musicbrainz_client, '_request_gate', RequestGate(0))
+
+
+def _client(routes, cache_dir=None):
+    client = MusicBrainzClient(cache_dir)
+    client.session = FakeSession(routes)
+    return client
+
+
+def test_credits_merge_works_and_roles():
+    """Credits of all works are merged in order; writers count as both roles."""
+    client = _client({
+        'recording/r1': _recording('w1', 'w2'),
+        'work/w1': _work(('lyricist', '林夕'), ('composer', 'C'), ('arranger', 'X')),
+        'work/w2': _work(('writer', 'W'), ('lyricist', '林夕')),
+    })
+
+    assert client.get_work_credits('r1') == {
+        'lyricist': ['林夕', 'W'],
+        'composer': ['C', 'W'],
+    }
+
+
+def test_busy_responses_are_retried():
+    """A 503 (rate limited) answer is retried before giving up."""
+    responses = iter([FakeResponse(503), _work(('composer', 'C'))])
+    client = _client({'recording/r1': _recording('w1'), 'work/w1': lambda: next(responses)})
+
+    assert client.get_work_credits('r1')['composer'] == ['C']
+    assert client.session.calls.count('work/w1') == 2
+
+
+def test_song_metadata_is_cached_when_complete(tmp_path):
+    """A complete answer is served from the cache without any request."""
+    routes = {
+        'recording': FakeResponse(200, {'recordings': [
+            {'id': 'r1', 'title': 'T', 'artist-credit': [{'name': 'A', 'joinphrase': ' & '}, {'name': 'B'}]},
+        ]}),
+        'recording/r1': _recording('w1'),
+        'work/w1': _work(('lyricist', 'L')),
+    }
+    metadata = _client(routes, tmp_path).get_song_metadata('T', 'A')
+    assert metadata['artist'] == 'A & B'
+    assert metadata['lyricist'] == ['L']
+
+    client = _client({}, tmp_path)
+    assert client.get_song_metadata(' t ', 'a') == metadata
+    assert client.session.calls == []
+
+
+def test_partial_lookups_are_not_cached(tmp_path):
+    """A failed work lookup keeps the song (and recording) out of the cache."""
+    work_w2 = {'response': FakeResponse(500)}
+    routes = {
+        'recording': FakeResponse(200, {'recordings': [
+            {'id': 'A', 'title': 'T'}, {'id': 'B', 'title': 'T'},
+        ]}),
+        'recording/A': _recording('w1', 'w2'),
+        'recording/B': _recording('w1'),
+        'work/w1': _work(('composer', 'C')),
+        'work/w2': lambda: work_w2['response'],
+    }
+    client = _client(routes, tmp_path)
+
+    # A is incomplete, so the complete recording B is preferred...
+    metadata = client.get_song_metadata('T')
+    assert metadata['musicbrainz_id'] == 'B'
+    # ...but the answer depended on a failed lookup and isn't stored
+    assert client._cache.get('song:t\n') is None
+    assert client._cache.get('recording:A') is None
+
+    work_w2['response'] = _work(('lyricist', 'L'))
+    metadata = client.get_song_metadata('T')
+    assert metadata['musicbrainz_id'] == 'A'
+    assert metadata['lyricist'] == ['L']
+    assert client._cache.get('song:t\n') == metadata
+
+
+def test_concurrent_recordings_share_work_lookups(monkeypatch):
+    """A work needed by two recordings is fetched once and credited to both."""
+    monkeypatch.setattr(musicbrainz_client, 'MAX_WORKERS', 2)
+
+    def slow(response, delay):
+        def route():
+            time.sleep(delay)
+            return response
+        return route
+
+    client = _client({
+        'recording': FakeResponse(200, {'recordings': [
+            {'id': 'A', 'title': 'T'}, {'id': 'B', 'title': 'T'},
+        ]}),
+        # B claims w1 first; A reaches it while B's fetch is in flight
+        'recording/A': slow(_recording('w2', 'w1'), 0.1),
+        'recording/B': _recording('w1'),
+        'work/w1': slow(_work(('lyricist', '林夕')), 0.3),
+        'work/w2': _work(('composer', 'Other')),
+    })
+
+    metadata = client.get_song_metadata('T')
+
+    assert metadata['musicbrainz_id'] == 'A'
+    assert metadata['lyricist'] == ['林夕']
+    assert metadata['composer'] == ['Other']
+    assert client.session.calls.count('work/w1') == 1
+
+
+def test_shared_lookups_propagate_errors():
+    """Waiters see the owner's exception, and the key is not fetched again."""
+    lookups = SharedLookups()
+    calls = []
+
+    def fail(key):
+        calls.append(key)
+        raise ValueError(key)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            lookups.get('w1', fail)
+    assert calls == ['w1']
+
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for request spacing across threads and worker processes."""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from video_analyzer.mv_reviewer.services.rate_limit import RequestGate, shared_gate_state
+
+_worker_gate = None
+
+
+def _init_gate_worker(state):
+    global _worker_gate
+    _worker_gate = RequestGate(0.1, state)
+
+
+def _wait_at_gate(_):
+    _worker_gate.wait()
+    return time.monotonic()
+
+
+def _assert_spaced(starts, begin, interval):
+    """Check that the n-th start came no earlier than n intervals after begin.
+
+    Wake-ups may run late, so gaps between measured starts can shrink;
+    the gate's slots, and sleep never returning early, bound them below.
+    """
+    for n, start in enumerate(sorted(starts)):
+        assert start >= begin + n * interval
+
+
+def test_request_gate_spaces_threads():
+    """Threads sharing a gate start their requests an interval apart."""
+    gate = RequestGate(0.05)
+    begin = time.monotonic()
+    starts = []
+    lock = threading.Lock()
+
+    def hit():
+        gate.wait()
+        with lock:
+            starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=hit) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    _assert_spaced(starts, begin, 0.05)
+
+
+def test_request_gate_spans_processes():
+    """Pool workers sharing the gate state space their requests together."""
+    context = multiprocessing.get_context()
+    begin = time.monotonic()
+    with ProcessPoolExecutor(
+        max_workers=3,
+        mp_context=context,
+        initializer=_init_gate_worker,
+        initargs=(shared_gate_state(context),)
+    ) as executor:
+        starts = list(executor.map(_wait_at_gate, range(6)))
+
+    _assert_spaced(starts, begin, 0.1)
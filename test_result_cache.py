@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the on-disk lookup cache and media fingerprints."""
+import multiprocessing
+
+from video_analyzer.mv_reviewer.services import result_cache
+from video_analyzer.mv_reviewer.services.result_cache import JsonCache, file_fingerprint
+
+
+def _write_entries(path, start, count):
+    cache = JsonCache(path)
+    for i in range(start, start + count):
+        cache.set(f"key{i}", {'value': i})
+
+
+def test_values_persist_across_instances(tmp_path):
+    """Values written by one instance are read back by another."""
+    path = tmp_path / 'cache.sqlite'
+    JsonCache(path).set('song', {'title': '红豆', 'composer': ['柳重言']})
+
+    assert JsonCache(path).get('song') == {'title': '红豆', 'composer': ['柳重言']}
+    assert JsonCache(path).get('missing') is None
+
+
+def test_concurrent_processes_keep_all_entries(tmp_path):
+    """Writers in different processes never drop each other's entries."""
+    path = tmp_path / 'cache.sqlite'
+    workers = [
+        multiprocessing.Process(target=_write_entries, args=(path, start, 50))
+        for start in (0, 50, 100, 150)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    cache = JsonCache(path)
+    assert all(cache.get(f"key{i}") == {'value': i} for i in range(200))
+
+
+def test_expired_entries_are_ignored_and_purged(tmp_path, monkeypatch):
+    """Entries older than the TTL are not returned and are deleted on open."""
+    path = tmp_path / 'cache.sqlite'
+    now = [1_000_000.0]
+    monkeypatch.setattr(result_cache.time, 'time', lambda: now[0])
+
+    cache = JsonCache(path, ttl=60)
+    cache.set('old', 1)
+    now[0] += 30
+    cache.set('new', 2)
+    now[0] += 45
+
+    assert cache.get('old') is None
+    assert cache.get('new') == 2
+
+    reopened = JsonCache(path, ttl=60)
+    assert reopened.get('new') == 2
+    rows = reopened._connect().execute("SELECT key FROM cache").fetchall()
+    assert rows == [('new',)]
+
+
+def test_unwritable_cache_is_ignored(tmp_path):
+    """A cache whose database can't be created degrades to misses."""
+    blocker = tmp_path / 'not_a_dir'
+    blocker.write_text('')
+    cache = JsonCache(blocker / 'cache.sqlite')
+
+    cache.set('key', 1)
+    assert cache.get('key') is None
+
+
+def test_file_fingerprint_follows_content(tmp_path):
+    """Fingerprints ignore the file name but change with size and content."""
+    original = tmp_path / 'a.mp4'
+    original.write_bytes(b'\x00' * 4096)
+    renamed = tmp_path / 'moved' / 'b.mp4'
+    renamed.parent.mkdir()
+    renamed.write_bytes(b'\x00' * 4096)
+
+    assert file_fingerprint(original) == file_fingerprint(renamed)
+
+    renamed.write_bytes(b'\x00' * 4095 + b'\x01')
+    assert file_fingerprint(original) != file_fingerprint(renamed)
+
+    # Only the first MiB is hashed, but the size always counts
+    original.write_bytes(b'\x00' * (result_cache.FINGERPRINT_BYTES + 10))
+    renamed.write_bytes(b'\x00' * (result_cache.FINGERPRINT_BYTES + 11))
+    assert file_fingerprint(original) != file_fingerprint(renamed)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for rule selection, rule ordering and violation moves (no ffmpeg)."""
+import errno
+import os
+
+import pytest
+
+from video_analyzer.mv_reviewer import MVReviewer
+from video_analyzer.mv_reviewer import reviewer as reviewer_module
+
+
+def _rule_ids(mask):
+    return [rule_id for rule_id in range(8) if mask & (1 << rule_id)]
+
+
+def test_rule_mask(tmp_path):
+    """Rules 4-7 map onto the single content rule (id 4)."""
+    reviewer = MVReviewer(enabled_rules=[2], temp_root=tmp_path)
+
+    assert _rule_ids(reviewer._build_rule_mask(None)) == [1, 2, 3, 4, 5, 6, 7]
+    assert _rule_ids(reviewer._build_rule_mask([])) == [1, 2, 3, 4, 5, 6, 7]
+    assert _rule_ids(reviewer._build_rule_mask([1, 3])) == [1, 3]
+    assert _rule_ids(reviewer._build_rule_mask([6])) == [4, 6]
+    assert _rule_ids(reviewer._build_rule_mask([0, 8, 2])) == [2]
+
+
+def test_only_selected_and_enabled_rules_run(tmp_path):
+    """Unselected rules and rules disabled in config are dropped."""
+    config = {'rules': {'volume': {'enabled': False}}}
+    reviewer = MVReviewer(config=config, enabled_rules=[1, 3, 5], temp_root=tmp_path)
+
+    assert [rule.rule_id for rule in reviewer.rules] == [1, 4]
+
+
+def test_stop_on_first_violation_runs_cheapest_first(tmp_path, monkeypatch):
+    """Rules run by cost_hint and stop at the first violation."""
+    monkeypatch.setattr(reviewer_module, 'ensure_probed', lambda context: True)
+    video = tmp_path / 'song.mp4'
+    video.write_bytes(b'')
+
+    reviewer = MVReviewer(temp_root=tmp_path)
+    assert [rule.cost_hint for rule in reviewer.rules] == sorted(
+        rule.cost_hint for rule in reviewer.rules
+    )
+
+    calls = []
+    for rule in reviewer.rules:
+        def check(context, rule=rule):
+            calls.append(rule.rule_id)
+            if rule.rule_id == 3:
+                return rule.create_violation('loud')
+            return None
+        monkeypatch.setattr(rule, 'check', check)
+
+    result = reviewer.review(video)
+
+    # Aspect (cost 1), then volume (cost 2) violates; metadata and content are skipped
+    assert calls == [2, 3]
+    assert [v.rule_id for v in result.violations] == [3]
+    assert result.is_violation
+
+
+def test_claim_and_move(tmp_path):
+    """The destination is claimed atomically and never overwritten."""
+    source = tmp_path / 'a.mp4'
+    source.write_bytes(b'new')
+    taken = tmp_path / 'out' / 'a.mp4'
+    taken.parent.mkdir()
+    taken.write_bytes(b'old')
+
+    with pytest.raises(FileExistsError):
+        MVReviewer._claim_and_move(source, taken)
+    assert source.read_bytes() == b'new'
+    assert taken.read_bytes() == b'old'
+
+    free = taken.parent / 'b.mp4'
+    MVReviewer._claim_and_move(source, free)
+    assert not source.exists()
+    assert free.read_bytes() == b'new'
+
+
+def test_claim_and_move_without_hard_links(tmp_path, monkeypatch):
+    """Across filesystems the move falls back to shutil.move, still without overwriting."""
+    def no_link(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+    monkeypatch.setattr(os, 'link', no_link)
+
+    source = tmp_path / 'a.mp4'
+    source.write_bytes(b'new')
+    taken = tmp_path / 'taken.mp4'
+    taken.write_bytes(b'old')
+
+    with pytest.raises(FileExistsError):
+        MVReviewer._claim_and_move(source, taken)
+    assert taken.read_bytes() == b'old'
+
+    MVReviewer._claim_and_move(source, tmp_path / 'free.mp4')
+    assert not source.exists()
+    assert (tmp_path / 'free.mp4').read_bytes() == b'new'
+
+
+def test_move_violation_renames_on_collision(tmp_path):
+    """Videos with the same name from different folders both survive the move."""
+    violation_dir = tmp_path / 'violations'
+    reviewer = MVReviewer(enabled_rules=[2], temp_root=tmp_path)
+
+    for folder in ('x', 'y'):
+        video = tmp_path / folder / 'song.mp4'
+        video.parent.mkdir()
+        video.write_bytes(folder.encode())
+        assert reviewer._move_violation(video, violation_dir)
+
+    moved = sorted(path.read_bytes() for path in violation_dir.iterdir())
+    assert moved == [b'x', b'y']
+    assert (violation_dir / 'song.mp4').exists()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized volume analysis (synthetic audio, no ffmpeg)."""
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from video_analyzer.mv_reviewer.models.review_result import ReviewContext
+from video_analyzer.mv_reviewer.rules.volume_rule import VolumeRule
+
+SAMPLE_RATE = 16000
+
+
+def _reference_levels(samples, segment_len, mode):
+    """Per-segment dBFS computed one segment at a time."""
+    levels = []
+    for start in range(0, len(samples), segment_len):
+        segment = [int(s) for s in samples[start:start + segment_len]]
+        if mode == 'peak':
+            amplitude = max(abs(s) for s in segment)
+        else:
+            amplitude = math.sqrt(sum(s * s for s in segment) / len(segment))
+        levels.append(20 * math.log10(amplitude / 32768.0) if amplitude else -60.0)
+    return levels
+
+
+def _tone(seconds, amplitude):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+@pytest.mark.parametrize('mode', ['rms', 'peak'])
+def test_levels_match_reference(mode):
+    """Vectorized levels match a per-segment computation, tail included."""
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-32768, 32768, size=int(3.4 * SAMPLE_RATE), dtype=np.int16)
+    samples[:10] = -32768  # full-scale negative must not overflow
+    samples[SAMPLE_RATE:2 * SAMPLE_RATE] = 0  # a silent segment
+
+    rule = VolumeRule({'level_mode': mode, 'segment_duration_ms': 1000})
+    volume_data = rule._analyze_volume(samples, SAMPLE_RATE)
+
+    assert volume_data[:, 0].tolist() == [0.0, 1.0, 2.0, 3.0]
+    np.testing.assert_allclose(
+        volume_data[:, 1], _reference_levels(samples, SAMPLE_RATE, mode), atol=1e-3
+    )
+
+
+def test_spikes_skip_silence():
+    """Level jumps are spikes, but jumps from or into silence are not."""
+    rule = VolumeRule({'change_threshold_db': 10.0})
+    volume_data = np.array([
+        [0.0, -30.0], [1.0, -29.0], [2.0, -12.0],  # +17 dB
+        [3.0, -60.0], [4.0, -20.0],                # silence in between
+        [5.0, -35.0],                              # -15 dB
+    ])
+
+    spikes = rule._detect_volume_spikes(volume_data)
+
+    assert [(s['time'], s['type']) for s in spikes] == [(2.0, 'increase'), (5.0, 'decrease')]
+    assert spikes[0]['change'] == pytest.approx(17.0)
+
+
+def test_check_reports_spike_from_cached_samples():
+    """check() analyzes the samples already decoded on the context."""
+    samples = np.concatenate([_tone(2, 1000), _tone(2, 20000)])
+    context = ReviewContext(
+        video_path=Path('unused.mp4'),
+        audio_samples=samples,
+        audio_sample_rate=SAMPLE_RATE,
+    )
+
+    violation = VolumeRule().check(context)
+
+    assert violation is not None
+    assert violation.details['spike_count'] == 1
+    assert violation.details['spikes'][0]['time'] == 2.0
+
+
+def test_silent_audio_is_skipped():
+    """A track below the silence level is not analyzed at all."""
+    context = ReviewContext(
+        video_path=Path('unused.mp4'),
+        audio_samples=np.zeros(SAMPLE_RATE * 2, dtype=np.int16),
+        audio_sample_rate=SAMPLE_RATE,
+    )
+
+    assert VolumeRule().check(context) is None
+    assert context._volume_data is None
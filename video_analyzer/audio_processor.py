@@ -4,7 +4,6 @@ from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
 import subprocess
 import torch
-from pydub import AudioSegment
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -86,8 +85,10 @@ class AudioProcessor:
                 return None
                 
             # If error is not about missing audio, try pydub as fallback
+            # (optional dependency, not in requirements.txt)
             logger.info("Falling back to pydub for audio extraction...")
             try:
+                from pydub import AudioSegment
                 video = AudioSegment.from_file(str(video_path))
                 audio = video.set_channels(1).set_frame_rate(16000)
                 audio.export(str(audio_path), format="wav")
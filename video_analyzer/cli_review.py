@@ -1,14 +1,16 @@
 """CLI entry point for MV content review."""
 
 import argparse
-import json
+import asyncio
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
 from .config import Config, get_client, get_model
 from .mv_reviewer import MVReviewer
+from .mv_reviewer.review_config import load_review_config
 from .clients.ollama import OllamaClient
 from .clients.generic_openai_api import GenericOpenAIAPIClient
 
@@ -34,6 +36,31 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
     )
 
 
+@lru_cache(maxsize=8)
+def _get_client(
+    client_type: str,
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    api_url: Optional[str] = None
+):
+    """Build an LLM client once per distinct setting and reuse it.
+
+    Args:
+        client_type: 'ollama' or 'openai_api'
+        url: Ollama server URL
+        api_key: API key for openai_api
+        api_url: API URL for openai_api
+
+    Returns:
+        LLM client instance or None for unknown types
+    """
+    if client_type == "ollama":
+        return OllamaClient(url)
+    elif client_type == "openai_api":
+        return GenericOpenAIAPIClient(api_key, api_url)
+    return None
+
+
 def create_llm_client(config: Config):
     """Create LLM client based on configuration.
 
@@ -47,70 +74,21 @@ def create_llm_client(config: Config):
         client_type = config.get("clients", {}).get("default", "ollama")
         client_config = get_client(config)
 
-        if client_type == "ollama":
-            return OllamaClient(client_config["url"])
-        elif client_type == "openai_api":
-            return GenericOpenAIAPIClient(
-                client_config["api_key"],
-                client_config["api_url"]
-            )
-        else:
+        client = _get_client(
+            client_type,
+            url=client_config.get("url"),
+            api_key=client_config.get("api_key"),
+            api_url=client_config.get("api_url")
+        )
+        if client is None:
             logging.warning(f"Unknown client type: {client_type}")
-            return None
+        return client
 
     except Exception as e:
         logging.warning(f"Could not create LLM client: {e}")
         return None
 
 
-def load_review_config(config_path: Optional[str] = None) -> dict:
-    """Load review-specific configuration.
-
-    Args:
-        config_path: Path to review config file
-
-    Returns:
-        Configuration dictionary
-    """
-    default_config = {
-        'rules': {
-            'metadata': {
-                'enabled': True,
-                'blocked_creators': ['林夕']
-            },
-            'aspect': {
-                'enabled': True,
-                'black_threshold': 15,
-                'border_ratio': 0.05
-            },
-            'volume': {
-                'enabled': True,
-                'change_threshold_db': 10.0,
-                'segment_duration_ms': 1000
-            },
-            'content': {
-                'enabled': True,
-                'confidence_threshold': 0.7
-            }
-        }
-    }
-
-    if config_path:
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
-                # Merge with defaults
-                for key, value in user_config.items():
-                    if isinstance(value, dict) and key in default_config:
-                        default_config[key].update(value)
-                    else:
-                        default_config[key] = value
-        except Exception as e:
-            logging.warning(f"Could not load review config: {e}")
-
-    return default_config
-
-
 # 默认LLM配置 (硅基流动)
 DEFAULT_LLM_CONFIG = {
     'api_url': 'https://api.siliconflow.cn/v1',
@@ -221,6 +199,23 @@ def main():
         action="store_true",
         help="递归搜索子目录"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="并发审核的视频数量 (默认: 1)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="LLM审核时并发处理的视频数量 (规则4-7, 默认: 1)"
+    )
+    parser.add_argument(
+        "--full-scan",
+        action="store_true",
+        help="违规后继续执行所有规则 (用于完整审计)"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -262,6 +257,8 @@ def main():
         config.config.setdefault('clients', {}).setdefault('openai_api', {})['api_url'] = args.api_url
 
     review_config = load_review_config(args.review_config)
+    if args.full_scan:
+        review_config['stop_on_first_violation'] = False
 
     # Create LLM client (only needed for rules 4-7)
     llm_client = None
@@ -300,18 +297,28 @@ def main():
     elif input_path.is_dir():
         # Batch review
         logger.info(f"批量审核目录: {input_path}")
-        results = reviewer.review_batch(
-            input_path,
-            violation_dir=violation_dir,
-            recursive=args.recursive
-        )
+        if llm_client is not None and args.concurrency > 1:
+            # LLM-bound: overlap HTTP round-trips across videos
+            video_files = reviewer.find_videos(input_path, recursive=args.recursive)
+            results = asyncio.run(reviewer.review_batch_async(
+                video_files,
+                violation_dir=violation_dir,
+                concurrency=args.concurrency
+            ))
+        else:
+            results = reviewer.review_batch(
+                input_path,
+                violation_dir=violation_dir,
+                recursive=args.recursive,
+                max_workers=args.workers
+            )
 
     else:
         logger.error(f"输入路径不存在: {input_path}")
         sys.exit(1)
 
-    # Generate and output report
-    report = MVReviewer.generate_report(results)
+    # Summarize results (full report is streamed to file below)
+    report = MVReviewer.summarize(results)
 
     # Print summary
     summary = report['summary']
@@ -335,8 +342,8 @@ def main():
     # Save report to file
     if args.report:
         report_path = Path(args.report)
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(report_path, 'wb') as f:
+            MVReviewer.write_report(results, f)
         logger.info(f"报告已保存: {report_path}")
 
     # Exit with appropriate code
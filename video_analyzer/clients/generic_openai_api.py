@@ -2,7 +2,7 @@ import requests
 import json
 import time
 import re
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from .llm_client import LLMClient
 import logging
 
@@ -15,6 +15,7 @@ DEFAULT_WAIT_TIME = 25  # seconds
 
 class GenericOpenAIAPIClient(LLMClient):
     def __init__(self, api_key: str, api_url: str, max_retries: int = DEFAULT_MAX_RETRIES):
+        super().__init__()  # per-thread HTTP sessions (see LLMClient.session)
         self.api_key = api_key
         self.base_url = api_url.rstrip('/')  # Remove trailing slash if present
         self.generate_url = f"{self.base_url}/chat/completions"
@@ -26,18 +27,18 @@ class GenericOpenAIAPIClient(LLMClient):
         stream: bool = False,
         model: str = "llama3.2-vision",
         temperature: float = 0.2,
-        num_predict: int = 256) -> Dict[Any, Any]:
+        num_predict: int = 256,
+        image_paths: Optional[List[str]] = None) -> Dict[Any, Any]:
         """Generate response from OpenAI-compatible API."""
         # Prepare request content
-        if image_path:
-            base64_image = self.encode_image(image_path)
-            content = [
-                {"type": "text", "text": prompt},
-                {
+        if image_paths or image_path:
+            content = [{"type": "text", "text": prompt}]
+            for path in image_paths or [image_path]:
+                base64_image = self.encode_image(path)
+                content.append({
                     "type": "image_url",
                     "image_url": {"url": f"data:image/jpeg;base64,{base64_image}"}
-                }
-            ]
+                })
         else:
             content = prompt
 
@@ -61,7 +62,7 @@ class GenericOpenAIAPIClient(LLMClient):
         # Try request with retries
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(self.generate_url, headers=headers, json=data)
+                response = self.session.post(self.generate_url, headers=headers, json=data)
                 response.raise_for_status()
                 
                 # Parse successful response
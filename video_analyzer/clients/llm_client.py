@@ -1,8 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import base64
+import threading
+
+import requests
 
 class LLMClient(ABC):
+    """Base class for LLM clients.
+
+    A client instance may be shared between threads (batch review and
+    frame workers). requests.Session is not documented as thread-safe,
+    so HTTP goes through ``self.session``, which is a separate session
+    (and connection pool) for each calling thread.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session of the calling thread, reused across its requests."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
     def encode_image(self, image_path: str) -> str:
         with open(image_path, "rb") as image_file:
             return base64.b64encode(image_file.read()).decode('utf-8')
@@ -14,5 +36,6 @@ class LLMClient(ABC):
         stream: bool = False,
         model: str = "llama3.2-vision",
         temperature: float = 0.2,
-        num_predict: int = 256) -> Dict[Any, Any]:
+        num_predict: int = 256,
+        image_paths: Optional[List[str]] = None) -> Dict[Any, Any]:
         pass
@@ -1,10 +1,11 @@
 import requests
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from .llm_client import LLMClient
 
 class OllamaClient(LLMClient):
     def __init__(self, base_url: str = "http://localhost:11434"):
+        super().__init__()  # per-thread HTTP sessions (see LLMClient.session)
         self.base_url = base_url.rstrip('/')
         self.generate_url = f"{self.base_url}/api/generate"
 
@@ -14,7 +15,8 @@ class OllamaClient(LLMClient):
         stream: bool = False,
         model: str = "llama3.2-vision",
         temperature: float = 0.2,
-        num_predict: int = 256) -> Dict[Any, Any]:
+        num_predict: int = 256,
+        image_paths: Optional[List[str]] = None) -> Dict[Any, Any]:
         try:
             # Build the request data
             data = {
@@ -27,11 +29,14 @@ class OllamaClient(LLMClient):
                 }
             }
             
-            if image_path:
+            if image_paths:
+                # Several frames in one request
+                data["images"] = [self.encode_image(path) for path in image_paths]
+            elif image_path:
                 # Use encode_image from parent LLMClient class
                 data["images"] = [self.encode_image(image_path)]
                     
-            response = requests.post(self.generate_url, json=data)
+            response = self.session.post(self.generate_url, json=data)
             response.raise_for_status()
             
             if stream:
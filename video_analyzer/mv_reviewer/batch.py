@@ -0,0 +1,275 @@
+"""Batch review: worker pools, concurrent reviews and violation moves."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import secrets
+import shutil
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .models.review_result import ReviewResult
+from .services.musicbrainz_client import use_shared_request_gate
+from .services.rate_limit import shared_gate_state
+
+logger = logging.getLogger(__name__)
+
+# Reviewer instance owned by each process pool worker
+_worker_reviewer: Optional[Any] = None
+
+
+def _init_worker(
+    reviewer_cls: type,
+    config: Dict[str, Any],
+    model: str,
+    enabled_rules: Optional[List[int]],
+    temp_root: Path,
+    request_gate_state: Any
+):
+    """Build one reviewer per worker process (LLM-free rules only)."""
+    global _worker_reviewer
+    # MusicBrainz's rate limit is per IP, so all workers share one gate
+    use_shared_request_gate(request_gate_state)
+    _worker_reviewer = reviewer_cls(
+        config=config,
+        model=model,
+        enabled_rules=enabled_rules,
+        temp_root=temp_root
+    )
+
+
+def _review_in_worker(video_path: Path) -> ReviewResult:
+    """Review a video with the worker's reviewer instance."""
+    return _worker_reviewer.review(video_path)
+
+
+class BatchReviewMixin:
+    """Batch review methods for MVReviewer.
+
+    Relies on the reviewer's review(), find_videos() and the attributes
+    needed to rebuild it in worker processes (config, llm_client, model,
+    enabled_rules, temp_root).
+    """
+
+    def review_batch(
+        self,
+        directory: Path,
+        violation_dir: Optional[Path] = None,
+        recursive: bool = False,
+        progress_callback: Optional[callable] = None,
+        max_workers: int = 1
+    ) -> List[ReviewResult]:
+        """Review all videos in a directory.
+
+        Args:
+            directory: Directory containing videos
+            violation_dir: Directory to move violations to
+            recursive: Whether to search subdirectories
+            progress_callback: Optional callback(current, total, video_name, result)
+            max_workers: Number of videos to review concurrently (1 = sequential)
+
+        Returns:
+            List of ReviewResult for all videos, in file order
+        """
+        video_files = self.find_videos(directory, recursive)
+        total = len(video_files)
+        results: List[Optional[ReviewResult]] = [None] * total
+
+        if max_workers <= 1 or total <= 1:
+            for i, video_path in enumerate(video_files, 1):
+                logger.info(f"[{i}/{total}] Processing: {video_path.name}")
+
+                result = self.review(video_path)
+                results[i - 1] = result
+                self._finish_review(i, total, video_path, result, violation_dir, progress_callback)
+
+            return results
+
+        # Moves and callbacks run here in the main thread as reviews complete,
+        # so violation renames never race each other
+        with self._create_executor(max_workers) as executor:
+            review_fn = self.review if isinstance(executor, ThreadPoolExecutor) else _review_in_worker
+            futures = {
+                executor.submit(review_fn, video_path): idx
+                for idx, video_path in enumerate(video_files)
+            }
+
+            for i, future in enumerate(as_completed(futures), 1):
+                idx = futures[future]
+                video_path = video_files[idx]
+                logger.info(f"[{i}/{total}] Finished: {video_path.name}")
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error reviewing {video_path.name}: {e}")
+                    result = ReviewResult(video_path=video_path, is_violation=False, error=str(e))
+
+                results[idx] = result
+                self._finish_review(i, total, video_path, result, violation_dir, progress_callback)
+
+        return results
+
+    async def review_batch_async(
+        self,
+        video_files: List[Path],
+        violation_dir: Optional[Path] = None,
+        progress_callback: Optional[callable] = None,
+        concurrency: int = 8
+    ) -> List[ReviewResult]:
+        """Review videos concurrently from an asyncio event loop.
+
+        Intended for LLM-bound batches: each review runs in a thread (the LLM
+        clients are blocking) with at most ``concurrency`` videos in flight,
+        while moves and callbacks run on the event loop as reviews complete.
+
+        Args:
+            video_files: Video files to review (see find_videos)
+            violation_dir: Directory to move violations to
+            progress_callback: Optional callback(current, total, video_name, result)
+            concurrency: Maximum number of videos reviewed at once
+
+        Returns:
+            List of ReviewResult, in the order of video_files
+        """
+        total = len(video_files)
+        results: List[Optional[ReviewResult]] = [None] * total
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+
+            async def review_one(idx: int):
+                try:
+                    return idx, await loop.run_in_executor(executor, self.review, video_files[idx])
+                except Exception as e:
+                    logger.error(f"Error reviewing {video_files[idx].name}: {e}")
+                    return idx, ReviewResult(video_path=video_files[idx], is_violation=False, error=str(e))
+
+            tasks = [review_one(idx) for idx in range(total)]
+            for i, task in enumerate(asyncio.as_completed(tasks), 1):
+                idx, result = await task
+                video_path = video_files[idx]
+                logger.info(f"[{i}/{total}] Finished: {video_path.name}")
+
+                results[idx] = result
+                self._finish_review(i, total, video_path, result, violation_dir, progress_callback)
+
+        return results
+
+    def _create_executor(self, max_workers: int) -> Executor:
+        """Create the pool used by review_batch.
+
+        Processes scale the CPU-bound rules (1-3). When an LLM client is
+        configured the work is dominated by network I/O and the client is
+        shared, so threads are used instead.
+
+        Args:
+            max_workers: Pool size
+
+        Returns:
+            Executor instance
+        """
+        if self.llm_client is not None:
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        # The shared gate must come from the context the pool starts with
+        mp_context = multiprocessing.get_context()
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(
+                type(self), self.config, self.model, self.enabled_rules, self.temp_root,
+                shared_gate_state(mp_context)
+            )
+        )
+
+    def _finish_review(
+        self,
+        current: int,
+        total: int,
+        video_path: Path,
+        result: ReviewResult,
+        violation_dir: Optional[Path],
+        progress_callback: Optional[callable]
+    ):
+        """Move a violating video and report progress for a finished review.
+
+        Args:
+            current: Number of reviews finished so far
+            total: Total number of videos
+            video_path: Path to video file
+            result: Review result for the video
+            violation_dir: Directory to move violations to
+            progress_callback: Optional callback(current, total, video_name, result)
+        """
+        # Move violation to violation directory
+        if result.is_violation and violation_dir:
+            self._move_violation(video_path, violation_dir)
+
+        # Call progress callback if provided
+        if progress_callback:
+            try:
+                progress_callback(current, total, video_path.name, result)
+            except Exception as e:
+                logger.warning(f"Progress callback error: {e}")
+
+    def _move_violation(self, video_path: Path, violation_dir: Path) -> bool:
+        """Move a violating video to the violation directory.
+
+        Args:
+            video_path: Path to video file
+            violation_dir: Target directory
+
+        Returns:
+            True if moved successfully
+        """
+        try:
+            violation_dir = Path(violation_dir)
+            violation_dir.mkdir(parents=True, exist_ok=True)
+
+            dest_path = violation_dir / video_path.name
+            stem = video_path.stem
+            suffix = video_path.suffix
+
+            # Handle duplicate names: claim the name atomically instead of
+            # probing with exists() (one syscall, no check-then-move race)
+            while True:
+                try:
+                    self._claim_and_move(video_path, dest_path)
+                    break
+                except FileExistsError:
+                    dest_path = violation_dir / f"{stem}_{secrets.token_hex(4)}{suffix}"
+
+            logger.info(f"  Moved to: {dest_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to move violation: {e}")
+            return False
+
+    @staticmethod
+    def _claim_and_move(video_path: Path, dest_path: Path):
+        """Move a file to a destination that must not exist yet.
+
+        os.rename() silently replaces an existing file on POSIX, so the
+        destination is claimed with os.link(), which fails with EEXIST.
+        Falls back to shutil.move() across filesystems or where hard
+        links are unsupported.
+
+        Raises:
+            FileExistsError: If dest_path already exists
+        """
+        try:
+            os.link(video_path, dest_path)
+        except FileExistsError:
+            raise
+        except OSError:
+            if dest_path.exists():
+                raise FileExistsError(str(dest_path))
+            shutil.move(str(video_path), str(dest_path))
+            return
+
+        os.unlink(video_path)
@@ -1,12 +1,16 @@
 """Data models for MV review results."""
 
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class SongMetadata:
     """Metadata for identified song."""
     title: Optional[str] = None
@@ -17,21 +21,37 @@ class SongMetadata:
     release_date: Optional[str] = None
     musicbrainz_id: Optional[str] = None
 
+    # Lowercased creator names, built once for repeated has_creator() calls
+    _lyricist_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _composer_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._lyricist_lower = tuple(l.lower() for l in self.lyricist or ())
+        self._composer_lower = tuple(c.lower() for c in self.composer or ())
+
     def has_creator(self, name: str) -> bool:
         """Check if a creator (lyricist or composer) matches the given name."""
         name_lower = name.lower()
-        if self.lyricist:
-            for l in self.lyricist:
-                if name_lower in l.lower():
-                    return True
-        if self.composer:
-            for c in self.composer:
-                if name_lower in c.lower():
-                    return True
-        return False
-
-
-@dataclass
+        return (any(name_lower in l for l in self._lyricist_lower)
+                or any(name_lower in c for c in self._composer_lower))
+
+    def matched_roles(self, name: str) -> List[str]:
+        """Get the roles (['作词', '作曲']) whose names contain the given name."""
+        name_lower = name.lower()
+        roles = []
+        if any(name_lower in l for l in self._lyricist_lower):
+            roles.append('作词')
+        if any(name_lower in c for c in self._composer_lower):
+            roles.append('作曲')
+        return roles
+
+    def iter_creators_lower(self) -> Iterator[str]:
+        """Iterate over lowercased lyricist and composer names."""
+        yield from self._lyricist_lower
+        yield from self._composer_lower
+
+
+@dataclass(slots=True)
 class RuleViolation:
     """Represents a single rule violation."""
     rule_id: int
@@ -50,11 +70,14 @@ class RuleViolation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewContext:
     """Context passed to each rule for evaluation."""
     video_path: Path
+    temp_dir: Optional[Path] = None
     audio_path: Optional[Path] = None
+    audio_samples: Optional['np.ndarray'] = None  # mono int16 PCM
+    audio_sample_rate: int = 0
     frames: List[Path] = field(default_factory=list)
     song_metadata: Optional[SongMetadata] = None
     video_width: int = 0
@@ -62,12 +85,27 @@ class ReviewContext:
     video_duration: float = 0.0
     fps: float = 0.0
 
+    # Filled once by video_probe.ensure_probed / ensure_first_frame
+    first_frame: Optional['np.ndarray'] = None  # grayscale (luma) frame
+    probed: bool = False
+
     # Cached analysis results
-    _volume_data: Optional[List[float]] = None
+    _volume_data: Optional['np.ndarray'] = None  # (timestamp, volume_db) rows
     _frame_analyses: Optional[List[Dict[str, Any]]] = None
 
+    # Serializes the audio decode when rules run concurrently
+    _audio_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # MVReviewer passes a dir under its temp root; standalone rule use
+        # falls back to a per-video dir beside the video
+        if self.temp_dir is None:
+            self.temp_dir = self.video_path.parent / ".mv_review_temp" / self.video_path.name
+
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Complete review result for a video."""
     video_path: Path
@@ -0,0 +1,120 @@
+"""Review summaries and the JSON report written by the CLI."""
+
+import json
+from typing import IO, Any, Dict, Iterator, List
+
+from .models.review_result import ReviewResult
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used instead
+    orjson = None
+
+
+def summarize(results: List[ReviewResult]) -> Dict[str, Any]:
+    """Compute summary counters and per-rule violation counts.
+
+    Args:
+        results: List of review results
+
+    Returns:
+        Dictionary with 'summary' and 'violations_by_rule'
+    """
+    total = len(results)
+    violated = passed = errors = 0
+    total_time = 0.0
+
+    # Count violations by rule
+    rule_counts: Dict[int, int] = {}
+    for result in results:
+        total_time += result.review_time
+        if result.error:
+            errors += 1
+        if result.is_violation:
+            violated += 1
+            for v in result.violations:
+                rule_counts[v.rule_id] = rule_counts.get(v.rule_id, 0) + 1
+        elif not result.error:
+            passed += 1
+
+    return {
+        'summary': {
+            'total': total,
+            'passed': passed,
+            'violated': violated,
+            'errors': errors,
+            'total_time_seconds': round(total_time, 2),
+            'average_time_seconds': round(total_time / total, 2) if total > 0 else 0
+        },
+        'violations_by_rule': rule_counts
+    }
+
+
+def generate_report(results: List[ReviewResult]) -> Dict[str, Any]:
+    """Generate a summary report from review results.
+
+    Args:
+        results: List of review results
+
+    Returns:
+        Report dictionary
+    """
+    report = summarize(results)
+    report['violations'] = [r.to_dict() for r in results if r.is_violation]
+    report['errors'] = [
+        {'video': str(r.video_path), 'error': r.error} for r in results if r.error
+    ]
+    return report
+
+
+def write_report(results: List[ReviewResult], f: IO[bytes]) -> Dict[str, Any]:
+    """Stream the report as indented UTF-8 JSON without building it in memory.
+
+    Produces the same document as json.dump(generate_report(results),
+    indent=2), but serializes one result at a time. Written as bytes so
+    orjson output goes to disk without a decode/encode round trip.
+
+    Args:
+        results: List of review results
+        f: Binary file opened for writing
+
+    Returns:
+        The summary part of the report (see summarize)
+    """
+    summary = summarize(results)
+
+    f.write(b'{\n')
+    for key, value in summary.items():
+        f.write(b'  "%s": %s,\n' % (key.encode(), _dumps(value, 1)))
+
+    _write_json_list(f, 'violations', (r.to_dict() for r in results if r.is_violation))
+    f.write(b',\n')
+    _write_json_list(
+        f, 'errors',
+        ({'video': str(r.video_path), 'error': r.error} for r in results if r.error)
+    )
+    f.write(b'\n}')
+
+    return summary
+
+
+def _dumps(value: Any, level: int) -> bytes:
+    """Serialize a value as indent-2 UTF-8 JSON nested ``level`` levels deep."""
+    if orjson is not None:
+        data = orjson.dumps(
+            value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        )
+    else:
+        data = json.dumps(value, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+    return data.replace(b'\n', b'\n' + b'  ' * level)
+
+
+def _write_json_list(f: IO[bytes], key: str, items: Iterator[Dict[str, Any]]):
+    """Write ``"key": [...]`` one item at a time."""
+    f.write(b'  "%s": [' % key.encode())
+    first = True
+    for item in items:
+        f.write(b'\n    ' if first else b',\n    ')
+        f.write(_dumps(item, 2))
+        first = False
+    f.write(b']' if first else b'\n  ]')
@@ -0,0 +1,76 @@
+"""Review configuration: built-in defaults merged with a JSON file."""
+
+import copy
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _read_review_config(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a review config file.
+
+    Cached per (path, mtime, size), so an edited file is re-read. Callers
+    must not mutate the returned dict.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_review_config(config_path: Optional[str] = None) -> dict:
+    """Load review-specific configuration.
+
+    Args:
+        config_path: Path to review config file
+
+    Returns:
+        Configuration dictionary
+    """
+    default_config = {
+        'stop_on_first_violation': True,
+        'rules': {
+            'metadata': {
+                'enabled': True,
+                'blocked_creators': ['林夕']
+            },
+            'aspect': {
+                'enabled': True,
+                'black_threshold': 15,
+                'border_ratio': 0.05
+            },
+            'volume': {
+                'enabled': True,
+                'change_threshold_db': 10.0,
+                'segment_duration_ms': 1000,
+                'level_mode': 'rms'
+            },
+            'content': {
+                'enabled': True,
+                'confidence_threshold': 0.7,
+                'frame_workers': 5,
+                'frame_cache_dir': '~/.cache/mv_reviewer/frames',
+                'batch_frames': False
+            }
+        }
+    }
+
+    if config_path:
+        try:
+            stat = os.stat(config_path)
+            user_config = copy.deepcopy(
+                _read_review_config(str(config_path), stat.st_mtime_ns, stat.st_size)
+            )
+            # Merge with defaults
+            for key, value in user_config.items():
+                if isinstance(value, dict) and key in default_config:
+                    default_config[key].update(value)
+                else:
+                    default_config[key] = value
+        except Exception as e:
+            logger.warning(f"Could not load review config: {e}")
+
+    return default_config
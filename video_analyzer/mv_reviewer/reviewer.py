@@ -1,33 +1,48 @@
 """Main MV Reviewer class that orchestrates all review rules."""
 
 import logging
+import os
 import shutil
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 
+from . import report
+from .batch import BatchReviewMixin
 from .models.review_result import ReviewResult, ReviewContext, RuleViolation
 from .rules.base_rule import BaseRule
 from .rules.metadata_rule import MetadataRule
 from .rules.aspect_rule import AspectRule
 from .rules.volume_rule import VolumeRule
 from .rules.content_rule import ContentRule
+from .services.video_probe import ensure_probed
 
 logger = logging.getLogger(__name__)
 
 
-class MVReviewer:
-    """Main class for reviewing music videos against configured rules."""
+class MVReviewer(BatchReviewMixin):
+    """Main class for reviewing music videos against configured rules.
 
-    # Supported video extensions
-    VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.ts'}
+    Batch review (review_batch, review_batch_async) comes from
+    BatchReviewMixin in batch.py.
+    """
+
+    # Supported video extensions (bare, lowercase)
+    VIDEO_EXTENSIONS = frozenset({'mp4', 'mkv', 'avi', 'mov', 'wmv', 'flv', 'webm', 'ts'})
+
+    # Bit per rule ID (1 << rule_id); the content rule (id 4) covers 4-7
+    ALL_RULES_MASK = 0b1111_1110
+    CONTENT_RULES_MASK = 0b1111_0000
 
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
         llm_client: Any = None,
         model: str = "llama3.2-vision",
-        enabled_rules: Optional[List[int]] = None
+        enabled_rules: Optional[List[int]] = None,
+        temp_root: Optional[Path] = None
     ):
         """Initialize MV Reviewer.
 
@@ -36,20 +51,54 @@ class MVReviewer:
             llm_client: LLM client for content analysis
             model: Model name for LLM
             enabled_rules: List of rule IDs to enable (1-7), None for all
+            temp_root: Directory for per-video temp files, None for a
+                process-scoped temp dir removed when the reviewer is dropped
         """
         self.config = config or {}
         self.llm_client = llm_client
         self.model = model
         self.enabled_rules = enabled_rules
+        self._enabled_mask = self._build_rule_mask(enabled_rules)
+        self.stop_on_first_violation = self.config.get('stop_on_first_violation', True)
+
+        # One local temp root for the whole run instead of a temp dir
+        # beside every video (which may live on a network share)
+        self._temp_dir = None
+        if temp_root is None:
+            self._temp_dir = tempfile.TemporaryDirectory(prefix='mvrev_')
+            temp_root = self._temp_dir.name
+        self.temp_root = Path(temp_root)
 
         # Initialize rules
         self.rules = self._init_rules()
 
+    def _build_rule_mask(self, enabled_rules: Optional[List[int]]) -> int:
+        """Build the rule-ID bitmask for the requested rules.
+
+        Args:
+            enabled_rules: List of rule IDs (1-7), None or empty for all
+
+        Returns:
+            Bitmask with bit ``rule_id`` set for every rule to run
+        """
+        if not enabled_rules:
+            return self.ALL_RULES_MASK
+
+        mask = 0
+        for rule_id in enabled_rules:
+            mask |= 1 << rule_id
+
+        # Content rule covers 4-7, so include it if any of 4-7 is enabled
+        if mask & self.CONTENT_RULES_MASK:
+            mask |= 1 << 4
+
+        return mask & self.ALL_RULES_MASK
+
     def _init_rules(self) -> List[BaseRule]:
         """Initialize all review rules.
 
         Returns:
-            List of initialized rule instances
+            List of initialized rule instances, cheapest first
         """
         rules_config = self.config.get('rules', {})
 
@@ -64,23 +113,15 @@ class MVReviewer:
             ),
         ]
 
-        # Filter by enabled rules if specified
-        if self.enabled_rules:
-            # Content rule covers 4-7, so include it if any of 4-7 is enabled
-            content_rule_ids = {4, 5, 6, 7}
-            enabled_set = set(self.enabled_rules)
-
-            filtered_rules = []
-            for rule in all_rules:
-                if rule.rule_id in enabled_set:
-                    filtered_rules.append(rule)
-                elif rule.rule_id == 4 and enabled_set & content_rule_ids:
-                    # Content rule covers 4-7
-                    filtered_rules.append(rule)
-
-            return filtered_rules
+        # Drop rules not selected or disabled in config, so review()
+        # never dispatches to them
+        all_rules = [
+            rule for rule in all_rules
+            if (1 << rule.rule_id) & self._enabled_mask and rule.enabled
+        ]
 
-        return all_rules
+        # Cheap rules first so stop_on_first_violation skips expensive ones
+        return sorted(all_rules, key=lambda rule: rule.cost_hint)
 
     def review(self, video_path: Path) -> ReviewResult:
         """Review a single video against all enabled rules.
@@ -103,26 +144,23 @@ class MVReviewer:
 
         logger.info(f"Reviewing: {video_path.name}")
 
-        # Build review context
-        context = ReviewContext(video_path=video_path)
-
-        # Run all rules
-        violations: List[RuleViolation] = []
-
-        for rule in self.rules:
-            try:
-                logger.debug(f"Running rule: {rule.rule_name}")
-                violation = rule.check(context)
+        # Build review context with its own temp subdir
+        context = ReviewContext(
+            video_path=video_path,
+            temp_dir=Path(tempfile.mkdtemp(prefix=f"{video_path.stem}_", dir=self.temp_root))
+        )
 
-                if violation:
-                    violations.append(violation)
-                    logger.info(f"  [VIOLATION] Rule {rule.rule_id}: {violation.description}")
+        # Probe stream information once for all rules
+        ensure_probed(context)
 
-            except Exception as e:
-                logger.error(f"Error running rule {rule.rule_name}: {e}")
+        # Run all rules
+        if self.stop_on_first_violation:
+            violations = self._run_rules_in_order(context)
+        else:
+            violations = self._run_rules_concurrently(context)
 
         # Cleanup temp files
-        self._cleanup_temp(video_path)
+        self._cleanup_temp(context.temp_dir)
 
         review_time = time.time() - start_time
 
@@ -134,147 +172,150 @@ class MVReviewer:
             review_time=review_time
         )
 
-    def review_batch(
-        self,
-        directory: Path,
-        violation_dir: Optional[Path] = None,
-        recursive: bool = False,
-        progress_callback: Optional[callable] = None
-    ) -> List[ReviewResult]:
-        """Review all videos in a directory.
+    def _run_rule(self, rule: BaseRule, context: ReviewContext) -> Optional[RuleViolation]:
+        """Run a single rule, logging instead of raising on errors.
 
         Args:
-            directory: Directory containing videos
-            violation_dir: Directory to move violations to
-            recursive: Whether to search subdirectories
-            progress_callback: Optional callback(current, total, video_name, result)
+            rule: Rule to run
+            context: Review context
 
         Returns:
-            List of ReviewResult for all videos
+            RuleViolation or None
         """
-        directory = Path(directory)
-        if not directory.is_dir():
-            logger.error(f"Not a directory: {directory}")
-            return []
-
-        # Find all video files
-        if recursive:
-            video_files = [
-                f for f in directory.rglob('*')
-                if f.suffix.lower() in self.VIDEO_EXTENSIONS
-            ]
-        else:
-            video_files = [
-                f for f in directory.iterdir()
-                if f.is_file() and f.suffix.lower() in self.VIDEO_EXTENSIONS
-            ]
+        try:
+            logger.debug(f"Running rule: {rule.rule_name}")
+            violation = rule.check(context)
 
-        # Sort for consistent ordering
-        video_files.sort()
+            if violation:
+                logger.info(f"  [VIOLATION] Rule {rule.rule_id}: {violation.description}")
+            return violation
 
-        logger.info(f"Found {len(video_files)} video files to review")
+        except Exception as e:
+            logger.error(f"Error running rule {rule.rule_name}: {e}")
+            return None
 
-        results = []
-        total = len(video_files)
+    def _run_rules_in_order(self, context: ReviewContext) -> List[RuleViolation]:
+        """Run rules cheapest first, stopping at the first violation.
 
-        for i, video_path in enumerate(video_files, 1):
-            logger.info(f"[{i}/{total}] Processing: {video_path.name}")
+        Args:
+            context: Review context
 
-            result = self.review(video_path)
-            results.append(result)
+        Returns:
+            List with at most one violation
+        """
+        for rule in self.rules:
+            violation = self._run_rule(rule, context)
 
-            # Move violation to violation directory
-            if result.is_violation and violation_dir:
-                self._move_violation(video_path, violation_dir)
+            # The video is a violation either way, skip remaining rules
+            if violation:
+                return [violation]
 
-            # Call progress callback if provided
-            if progress_callback:
-                try:
-                    progress_callback(i, total, video_path.name, result)
-                except Exception as e:
-                    logger.warning(f"Progress callback error: {e}")
+        return []
 
-        return results
+    def _run_rules_concurrently(self, context: ReviewContext) -> List[RuleViolation]:
+        """Run all rules, overlapping I/O-bound rules with CPU-bound ones.
 
-    def _move_violation(self, video_path: Path, violation_dir: Path) -> bool:
-        """Move a violating video to the violation directory.
+        Rules with workload 'io' (network lookups, LLM requests) run on
+        threads while the remaining rules run in the calling thread.
+        Violations are returned in rule order.
 
         Args:
-            video_path: Path to video file
-            violation_dir: Target directory
+            context: Review context
 
         Returns:
-            True if moved successfully
+            List of violations found
         """
-        try:
-            violation_dir = Path(violation_dir)
-            violation_dir.mkdir(parents=True, exist_ok=True)
+        io_rules = [rule for rule in self.rules if rule.workload == 'io']
+        if not io_rules:
+            results = [self._run_rule(rule, context) for rule in self.rules]
+            return [violation for violation in results if violation]
+
+        with ThreadPoolExecutor(max_workers=len(io_rules)) as executor:
+            futures = {
+                rule: executor.submit(self._run_rule, rule, context)
+                for rule in io_rules
+            }
+            results = {
+                rule: self._run_rule(rule, context)
+                for rule in self.rules if rule.workload != 'io'
+            }
+            for rule, future in futures.items():
+                results[rule] = future.result()
+
+        return [results[rule] for rule in self.rules if results[rule]]
+
+    def find_videos(self, directory: Path, recursive: bool = False) -> List[Path]:
+        """Find all video files in a directory, sorted for consistent ordering.
 
-            dest_path = violation_dir / video_path.name
+        Args:
+            directory: Directory containing videos
+            recursive: Whether to search subdirectories
 
-            # Handle duplicate names
-            if dest_path.exists():
-                stem = video_path.stem
-                suffix = video_path.suffix
-                counter = 1
-                while dest_path.exists():
-                    dest_path = violation_dir / f"{stem}_{counter}{suffix}"
-                    counter += 1
+        Returns:
+            Sorted list of video paths (empty if directory is invalid)
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            logger.error(f"Not a directory: {directory}")
+            return []
 
-            shutil.move(str(video_path), str(dest_path))
-            logger.info(f"  Moved to: {dest_path}")
-            return True
+        video_files = sorted(self._iter_videos(directory, recursive))
+        logger.info(f"Found {len(video_files)} video files to review")
+        return video_files
 
-        except Exception as e:
-            logger.error(f"Failed to move violation: {e}")
-            return False
+    def _iter_videos(self, root: Path, recursive: bool) -> Iterator[Path]:
+        """Yield video files under a directory using os.scandir.
 
-    def _cleanup_temp(self, video_path: Path):
-        """Clean up temporary files created during review.
+        Entry types come from the directory listing itself, so non-video
+        files are rejected by name without a stat call or Path object.
+        Hidden directories (including .mv_review_temp) are skipped.
 
         Args:
-            video_path: Path to video file
+            root: Directory to search
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            Paths of video files
         """
-        temp_dir = video_path.parent / ".mv_review_temp"
-        if temp_dir.exists():
+        stack = [str(root)]
+        while stack:
             try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp dir: {e}")
-
-    @staticmethod
-    def generate_report(results: List[ReviewResult]) -> Dict[str, Any]:
-        """Generate a summary report from review results.
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if recursive and entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                        elif self._is_video_name(entry.name) and entry.is_file():
+                            yield Path(entry.path)
+            except OSError as e:
+                logger.warning(f"Could not scan directory: {e}")
+
+    def _is_video_name(self, name: str) -> bool:
+        """Check a file name against VIDEO_EXTENSIONS.
 
         Args:
-            results: List of review results
+            name: File name
 
         Returns:
-            Report dictionary
+            True if the extension is a supported video format
         """
-        total = len(results)
-        violations = [r for r in results if r.is_violation]
-        passed = [r for r in results if not r.is_violation and not r.error]
-        errors = [r for r in results if r.error]
-
-        total_time = sum(r.review_time for r in results)
-
-        # Count violations by rule
-        rule_counts: Dict[int, int] = {}
-        for result in violations:
-            for v in result.violations:
-                rule_counts[v.rule_id] = rule_counts.get(v.rule_id, 0) + 1
-
-        return {
-            'summary': {
-                'total': total,
-                'passed': len(passed),
-                'violated': len(violations),
-                'errors': len(errors),
-                'total_time_seconds': round(total_time, 2),
-                'average_time_seconds': round(total_time / total, 2) if total > 0 else 0
-            },
-            'violations_by_rule': rule_counts,
-            'violations': [r.to_dict() for r in violations],
-            'errors': [{'video': str(r.video_path), 'error': r.error} for r in errors]
-        }
+        dot = name.rfind('.')
+        return dot > 0 and name[dot + 1:].lower() in self.VIDEO_EXTENSIONS
+
+    def _cleanup_temp(self, temp_dir: Path):
+        """Clean up temporary files created during review.
+
+        Args:
+            temp_dir: Per-video temp directory from the review context
+        """
+        try:
+            shutil.rmtree(temp_dir)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to cleanup temp dir: {e}")
+
+    # Report helpers, kept here for existing callers (see report.py)
+    summarize = staticmethod(report.summarize)
+    generate_report = staticmethod(report.generate_report)
+    write_report = staticmethod(report.write_report)
@@ -1,10 +1,25 @@
 """Review rules for MV content checking."""
 
+import importlib
+
 from .base_rule import BaseRule
-from .metadata_rule import MetadataRule
-from .aspect_rule import AspectRule
-from .volume_rule import VolumeRule
-from .content_rule import ContentRule
+
+# Rule modules are imported on first access so their dependencies
+# (OpenCV, Numba, ...) are only loaded when a rule is actually used
+_LAZY_RULES = {
+    'MetadataRule': '.metadata_rule',
+    'AspectRule': '.aspect_rule',
+    'VolumeRule': '.volume_rule',
+    'ContentRule': '.content_rule',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_RULES:
+        module = importlib.import_module(_LAZY_RULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'BaseRule',
@@ -1,16 +1,85 @@
 """Rule 2: Vertical video and black border detection."""
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
-import cv2
 import numpy as np
 
 from .base_rule import BaseRule
 from ..models.review_result import RuleViolation, ReviewContext
+from ..services.video_probe import ensure_probed, ensure_first_frame
 
 logger = logging.getLogger(__name__)
 
+# Numba kernel, compiled on first use (False when numba is unavailable)
+_compiled_scan_borders = None
+
+
+def _get_scan_borders():
+    """Compile _scan_borders with Numba on first use.
+
+    Returns:
+        Compiled kernel, or None if numba is not installed
+    """
+    global _compiled_scan_borders
+    if _compiled_scan_borders is None:
+        try:
+            from numba import njit
+            _compiled_scan_borders = njit(cache=True, nogil=True)(_scan_borders)
+        except ImportError:  # numba is optional, NumPy path is used instead
+            _compiled_scan_borders = False
+    return _compiled_scan_borders or None
+
+
+def _scan_borders(gray, threshold):
+    """Fused early-exit border scan over a grayscale frame.
+
+    Each side stops at the first line whose mean exceeds ``threshold``,
+    so only the border lines plus one content line are read. Only meant
+    to run compiled (see _get_scan_borders).
+
+    Returns:
+        (top, bottom, left, right) border ratios, 0.5 if half is black
+    """
+    height, width = gray.shape
+    top = bottom = left = right = 0.5
+
+    row_limit = threshold * width
+    for i in range(height // 2):
+        s = 0
+        for j in range(width):
+            s += gray[i, j]
+        if s > row_limit:
+            top = i / height
+            break
+
+    for i in range(height - 1, height // 2, -1):
+        s = 0
+        for j in range(width):
+            s += gray[i, j]
+        if s > row_limit:
+            bottom = (height - 1 - i) / height
+            break
+
+    col_limit = threshold * height
+    for j in range(width // 2):
+        s = 0
+        for i in range(height):
+            s += gray[i, j]
+        if s > col_limit:
+            left = j / width
+            break
+
+    for j in range(width - 1, width // 2, -1):
+        s = 0
+        for i in range(height):
+            s += gray[i, j]
+        if s > col_limit:
+            right = (width - 1 - j) / width
+            break
+
+    return top, bottom, left, right
+
 
 class AspectRule(BaseRule):
     """Rule to detect vertical videos and black borders.
@@ -23,11 +92,15 @@ class AspectRule(BaseRule):
     rule_id = 2
     rule_name = "竖屏/黑边检测"
     rule_description = "检测竖屏视频或黑边占比>=40%的视频"
+    cost_hint = 1  # ffprobe + one frame
 
     # Default thresholds
     DEFAULT_BLACK_THRESHOLD = 15      # Pixel value below this is considered black
     DEFAULT_TOTAL_BORDER_RATIO = 0.40 # Total border ratio threshold (40%)
 
+    # Long edge (px) the frame is downsampled to before scanning borders
+    DETECTION_SIZE = 256
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize aspect rule.
 
@@ -57,22 +130,15 @@ class AspectRule(BaseRule):
             return None
 
         try:
-            # Open video to get dimensions and first frame
-            cap = cv2.VideoCapture(str(context.video_path))
-            if not cap.isOpened():
-                logger.error(f"Could not open video: {context.video_path}")
+            # Dimensions are probed once per video from the container header
+            if not ensure_probed(context):
                 return None
 
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-
-            # Update context with video dimensions
-            context.video_width = width
-            context.video_height = height
+            width = context.video_width
+            height = context.video_height
 
             # Check 1: Vertical video
             if height > width:
-                cap.release()
                 return self.create_violation(
                     description=f"检测到竖屏视频 (宽:{width} x 高:{height})",
                     confidence=1.0,
@@ -84,11 +150,10 @@ class AspectRule(BaseRule):
                     }
                 )
 
-            # Read first frame for black border detection
-            ret, frame = cap.read()
-            cap.release()
+            # Decode the first frame only for horizontal videos
+            frame = ensure_first_frame(context)
 
-            if not ret or frame is None:
+            if frame is None:
                 logger.error("Could not read video frame")
                 return None
 
@@ -126,18 +191,33 @@ class AspectRule(BaseRule):
         New logic: Violation if top+bottom >= 40% OR left+right >= 40%
 
         Args:
-            frame: Video frame as numpy array
+            frame: Grayscale frame, or BGR frame which is converted first
 
         Returns:
             Dictionary with border detection results
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if frame.ndim == 3:
+            import cv2
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        gray = self._downsample(frame)
 
         # Get individual border ratios
-        top_ratio = self._get_border_ratio(gray, 'top')
-        bottom_ratio = self._get_border_ratio(gray, 'bottom')
-        left_ratio = self._get_border_ratio(gray, 'left')
-        right_ratio = self._get_border_ratio(gray, 'right')
+        kernel = _get_scan_borders()
+        if kernel is not None:
+            top_ratio, bottom_ratio, left_ratio, right_ratio = kernel(
+                gray, float(self.black_threshold)
+            )
+        elif self._edges_non_black(gray):
+            # Common case (no borders at all): skip the full reduction
+            top_ratio = bottom_ratio = left_ratio = right_ratio = 0.0
+        else:
+            row_sums, col_sums = self._compute_sums(gray)
+            height, width = gray.shape
+            top_ratio = self._get_border_ratio(row_sums, width)
+            bottom_ratio = self._get_border_ratio(row_sums, width, from_end=True)
+            left_ratio = self._get_border_ratio(col_sums, height)
+            right_ratio = self._get_border_ratio(col_sums, height, from_end=True)
 
         # Calculate totals
         vertical_total = top_ratio + bottom_ratio    # 上下黑边总和
@@ -181,44 +261,92 @@ class AspectRule(BaseRule):
             'confidence': confidence
         }
 
-    def _get_border_ratio(self, gray: np.ndarray, side: str) -> float:
-        """Calculate the ratio of black pixels on a specific side.
+    def _downsample(self, gray: np.ndarray) -> np.ndarray:
+        """Shrink the frame so its long edge is at most DETECTION_SIZE.
+
+        Area interpolation averages pixels, so line luminance and the
+        resulting border ratios are preserved.
 
         Args:
             gray: Grayscale frame
-            side: 'top', 'bottom', 'left', or 'right'
 
         Returns:
-            Ratio of frame height/width that is black border
+            Downsampled frame (or the input if already small enough)
         """
         height, width = gray.shape
+        scale = self.DETECTION_SIZE / max(height, width)
+        if scale >= 1.0:
+            return gray
 
-        if side == 'top':
-            for i in range(height // 2):
-                row = gray[i, :]
-                if np.mean(row) > self.black_threshold:
-                    return i / height
-            return 0.5
+        import cv2
 
-        elif side == 'bottom':
-            for i in range(height - 1, height // 2, -1):
-                row = gray[i, :]
-                if np.mean(row) > self.black_threshold:
-                    return (height - 1 - i) / height
-            return 0.5
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
 
-        elif side == 'left':
-            for i in range(width // 2):
-                col = gray[:, i]
-                if np.mean(col) > self.black_threshold:
-                    return i / width
-            return 0.5
+    def _edges_non_black(self, gray: np.ndarray) -> bool:
+        """Check whether all four outermost lines of the frame are non-black.
+
+        Reads only the edge rows and columns, so frames without any
+        border are settled without summing the whole frame.
+
+        Args:
+            gray: Grayscale frame
+
+        Returns:
+            True if no side starts with a black line
+        """
+        height, width = gray.shape
+        if height < 3 or width < 3:
+            return False
+
+        row_limit = self.black_threshold * width
+        col_limit = self.black_threshold * height
+        return bool(
+            gray[0].sum(dtype=np.int32) > row_limit
+            and gray[-1].sum(dtype=np.int32) > row_limit
+            and gray[:, 0].sum(dtype=np.int32) > col_limit
+            and gray[:, -1].sum(dtype=np.int32) > col_limit
+        )
+
+    @staticmethod
+    def _compute_sums(gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum the luminance of every row and column in one pass each.
+
+        Sums stay in int32 (no float promotion of the uint8 frame); a
+        line is black when its sum is at most threshold * line length.
+
+        Args:
+            gray: Grayscale frame
+
+        Returns:
+            Tuple of (row_sums, col_sums)
+        """
+        return gray.sum(axis=1, dtype=np.int32), gray.sum(axis=0, dtype=np.int32)
+
+    def _get_border_ratio(
+        self,
+        sums: np.ndarray,
+        line_length: int,
+        from_end: bool = False
+    ) -> float:
+        """Calculate the black border ratio from precomputed line sums.
+
+        Scans at most half of the lines, starting from the first line
+        (top/left) or the last line (bottom/right) when ``from_end`` is set.
+
+        Args:
+            sums: Row sums (top/bottom) or column sums (left/right)
+            line_length: Pixels per line (frame width for rows, height for columns)
+            from_end: Scan from the end of the axis instead of the start
+
+        Returns:
+            Ratio of frame height/width that is black border
+        """
+        length = len(sums)
+        scan = sums[:length // 2:-1] if from_end else sums[:length // 2]
 
-        elif side == 'right':
-            for i in range(width - 1, width // 2, -1):
-                col = gray[:, i]
-                if np.mean(col) > self.black_threshold:
-                    return (width - 1 - i) / width
+        non_black = scan > self.black_threshold * line_length
+        if not non_black.any():
             return 0.5
 
-        return 0.0
+        return int(np.argmax(non_black)) / length
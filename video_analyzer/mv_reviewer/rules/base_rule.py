@@ -15,6 +15,8 @@ class BaseRule(ABC):
     rule_id: int = 0
     rule_name: str = "Base Rule"
     rule_description: str = ""
+    cost_hint: int = 0  # Relative cost, rules run cheapest first
+    workload: str = 'cpu'  # 'io' rules mostly wait on network and may run on threads
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize rule with optional configuration.
@@ -1,11 +1,17 @@
 """Rules 4-7: Content review using Vision LLM."""
 
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from .base_rule import BaseRule
 from ..models.review_result import RuleViolation, ReviewContext
+from ..services.json_spans import load_first_json
+from ..services.result_cache import DEFAULT_CACHE_DIR
+from ..services.video_probe import extract_sample_frames
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,8 @@ class ContentRule(BaseRule):
     rule_id = 4  # Primary rule ID (covers 4-7)
     rule_name = "内容审核"
     rule_description = "检测暴露、导向问题、纯风景、广告、吸毒等内容"
+    cost_hint = 4  # one Vision LLM request per frame
+    workload = 'io'
 
     # Content check types with their rule IDs
     CONTENT_CHECKS = {
@@ -34,6 +42,8 @@ class ContentRule(BaseRule):
     }
 
     DEFAULT_CONFIDENCE_THRESHOLD = 0.7
+    DEFAULT_FRAME_WORKERS = 5  # Concurrent LLM requests per video
+    DEFAULT_FRAME_CACHE_DIR = DEFAULT_CACHE_DIR / "frames"
 
     def __init__(
         self,
@@ -55,7 +65,17 @@ class ContentRule(BaseRule):
             'confidence_threshold',
             self.DEFAULT_CONFIDENCE_THRESHOLD
         )
+        self.frame_workers = self.config.get(
+            'frame_workers',
+            self.DEFAULT_FRAME_WORKERS
+        )
+        # Send all frames in one multi-image request (model must support it)
+        self.batch_frames = self.config.get('batch_frames', False)
+        # Frames persist across runs; null keeps them in the per-video temp dir
+        frame_cache_dir = self.config.get('frame_cache_dir', self.DEFAULT_FRAME_CACHE_DIR)
+        self.frame_cache_dir = Path(frame_cache_dir).expanduser() if frame_cache_dir else None
         self.prompt_template = self._load_prompt_template()
+        self.batch_prompt_template = self._load_batch_prompt_template()
 
     def _load_prompt_template(self) -> str:
         """Load the content review prompt template."""
@@ -76,6 +96,34 @@ class ContentRule(BaseRule):
   "drug_use": {"detected": false, "confidence": 0.0, "description": ""}
 }
 
+注意：
+- detected: 是否检测到该类型内容 (true/false)
+- confidence: 置信度 (0.0-1.0)
+- description: 简短描述检测到的内容（中文）
+- 如果画面正常，所有detected都应为false"""
+
+    def _load_batch_prompt_template(self) -> str:
+        """Load the prompt used to review several frames in one request.
+
+        ``{count}`` is replaced by the number of attached frames.
+        """
+        return """你是一个专业的视频内容审核员。下面按时间顺序提供了同一个视频的{count}个视频帧，请逐帧分析，检查是否存在以下违规内容：
+
+1. 暴露内容 (exposure)：裸露、性暗示、不雅动作、低俗色情
+2. 导向问题 (inappropriate)：政治敏感内容、暴力血腥、恐怖画面、不当价值观
+3. 纯风景背景 (landscape_only)：画面仅有自然风景（山水、天空、海洋、森林等），完全没有人物、歌手或其他主体内容
+4. 广告内容 (advertisement)：商品展示、品牌logo、促销信息、二维码、购物链接
+5. 吸毒画面 (drug_use)：吸食毒品、注射器、毒品相关物品、吸毒动作
+
+请以严格的JSON数组格式返回检测结果，数组按帧的顺序包含{count}个对象，不要添加任何其他文字。每个对象的格式如下：
+{
+  "exposure": {"detected": false, "confidence": 0.0, "description": ""},
+  "inappropriate": {"detected": false, "confidence": 0.0, "description": ""},
+  "landscape_only": {"detected": false, "confidence": 0.0, "description": ""},
+  "advertisement": {"detected": false, "confidence": 0.0, "description": ""},
+  "drug_use": {"detected": false, "confidence": 0.0, "description": ""}
+}
+
 注意：
 - detected: 是否检测到该类型内容 (true/false)
 - confidence: 置信度 (0.0-1.0)
@@ -99,18 +147,35 @@ class ContentRule(BaseRule):
             return None
 
         try:
-            # Get frames to analyze
-            frames = self._get_frames_to_analyze(context)
-            if not frames:
-                logger.warning("No frames available for content analysis")
-                return None
-
-            # Analyze each frame
+            # Query the LLM once per frame, cached on context
+            if context._frame_analyses is None:
+                # Get frames to analyze
+                frames = self._get_frames_to_analyze(context)
+                if not frames:
+                    logger.warning("No frames available for content analysis")
+                    return None
+
+                results = None
+                if self.batch_frames and len(frames) > 1:
+                    results = self._analyze_frames(frames)
+
+                if results is None:
+                    # LLM calls are network-bound, so frames are sent concurrently
+                    workers = max(1, min(self.frame_workers, len(frames)))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        results = list(executor.map(self._analyze_frame, frames))
+
+                context._frame_analyses = [
+                    {'frame_path': frame_path, 'result': result}
+                    for frame_path, result in zip(frames, results)
+                ]
+
+            # Collect violations from each frame
             all_violations = []
-            for frame_path in frames:
-                frame_result = self._analyze_frame(frame_path)
-                if frame_result:
-                    all_violations.extend(frame_result)
+            for analysis in context._frame_analyses:
+                all_violations.extend(
+                    self._collect_violations(analysis['frame_path'], analysis['result'])
+                )
 
             # Return first violation found (most severe)
             if all_violations:
@@ -137,50 +202,26 @@ class ContentRule(BaseRule):
             # Use pre-extracted frames
             return [str(f) for f in context.frames[:5]]  # Analyze up to 5 frames
 
-        # Extract frames from video
-        import cv2
-        from pathlib import Path
-
-        temp_dir = context.video_path.parent / ".mv_review_temp" / "frames"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-
-        cap = cv2.VideoCapture(str(context.video_path))
-        if not cap.isOpened():
-            return []
-
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        duration = total_frames / fps if fps > 0 else 0
-
-        # Sample 5 frames evenly distributed
-        frame_paths = []
-        sample_points = [0.1, 0.3, 0.5, 0.7, 0.9]  # 10%, 30%, 50%, 70%, 90%
+        # Extract frames from video into the persistent cache, so
+        # re-reviewing an unchanged video skips decoding
+        if self.frame_cache_dir:
+            key = hashlib.sha1(str(context.video_path.resolve()).encode('utf-8')).hexdigest()
+            output_dir = self.frame_cache_dir / key[:16]
+        else:
+            output_dir = context.temp_dir / "frames"
 
-        for i, point in enumerate(sample_points):
-            frame_num = int(total_frames * point)
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-            ret, frame = cap.read()
+        context.frames = extract_sample_frames(context.video_path, output_dir)
+        return [str(f) for f in context.frames]
 
-            if ret:
-                frame_path = temp_dir / f"content_frame_{i}.jpg"
-                cv2.imwrite(str(frame_path), frame)
-                frame_paths.append(str(frame_path))
-
-        cap.release()
-        context.frames = [Path(p) for p in frame_paths]
-        return frame_paths
-
-    def _analyze_frame(self, frame_path: str) -> List[RuleViolation]:
-        """Analyze a single frame for content violations.
+    def _analyze_frame(self, frame_path: str) -> Optional[Dict[str, Any]]:
+        """Analyze a single frame with the Vision LLM.
 
         Args:
             frame_path: Path to frame image
 
         Returns:
-            List of violations found in this frame
+            Parsed LLM result or None
         """
-        violations = []
-
         try:
             # Call LLM with frame
             response = self.llm_client.generate(
@@ -194,32 +235,81 @@ class ContentRule(BaseRule):
             response_text = response.get('response', '')
 
             # Parse JSON response
-            result = self._parse_llm_response(response_text)
-            if not result:
-                return violations
-
-            # Check each content type
-            for check_type, check_info in self.CONTENT_CHECKS.items():
-                if check_type in result:
-                    check_result = result[check_type]
-                    if (check_result.get('detected', False) and
-                        check_result.get('confidence', 0) >= self.confidence_threshold):
-
-                        violation = RuleViolation(
-                            rule_id=check_info['rule_id'],
-                            rule_name=check_info['name'],
-                            description=check_result.get('description', f'检测到{check_info["name"]}'),
-                            confidence=check_result.get('confidence', 0.8),
-                            details={
-                                'check_type': check_type,
-                                'frame_path': frame_path,
-                                'raw_result': check_result
-                            }
-                        )
-                        violations.append(violation)
+            return self._parse_llm_response(response_text)
 
         except Exception as e:
             logger.error(f"Error analyzing frame {frame_path}: {e}")
+            return None
+
+    def _analyze_frames(self, frame_paths: List[str]) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Analyze all frames with a single multi-image LLM request.
+
+        Args:
+            frame_paths: Paths to frame images, in video order
+
+        Returns:
+            Parsed result per frame, or None if the request failed or the
+            response doesn't contain one result per frame
+        """
+        try:
+            response = self.llm_client.generate(
+                prompt=self.batch_prompt_template.replace('{count}', str(len(frame_paths))),
+                image_paths=frame_paths,
+                model=self.model,
+                temperature=0.1,
+                num_predict=500 * len(frame_paths)
+            )
+
+            results = self._parse_llm_batch_response(response.get('response', ''))
+
+        except Exception as e:
+            logger.error(f"Error analyzing frames in one request: {e}")
+            return None
+
+        if results is None or len(results) != len(frame_paths):
+            logger.warning("Batched frame analysis returned no usable result, analyzing frames one by one")
+            return None
+
+        return [result if isinstance(result, dict) else None for result in results]
+
+    def _collect_violations(
+        self,
+        frame_path: str,
+        result: Optional[Dict[str, Any]]
+    ) -> List[RuleViolation]:
+        """Build violations from a parsed frame result.
+
+        Args:
+            frame_path: Path to frame image
+            result: Parsed LLM result for the frame
+
+        Returns:
+            List of violations found in this frame
+        """
+        violations = []
+
+        if not result:
+            return violations
+
+        # Check each content type
+        for check_type, check_info in self.CONTENT_CHECKS.items():
+            check_result = result.get(check_type)
+            if isinstance(check_result, dict):
+                if (check_result.get('detected', False) and
+                    check_result.get('confidence', 0) >= self.confidence_threshold):
+
+                    violation = RuleViolation(
+                        rule_id=check_info['rule_id'],
+                        rule_name=check_info['name'],
+                        description=check_result.get('description', f'检测到{check_info["name"]}'),
+                        confidence=check_result.get('confidence', 0.8),
+                        details={
+                            'check_type': check_type,
+                            'frame_path': frame_path,
+                            'raw_result': check_result
+                        }
+                    )
+                    violations.append(violation)
 
         return violations
 
@@ -233,19 +323,28 @@ class ContentRule(BaseRule):
             Parsed dictionary or None
         """
         try:
-            # Try to find JSON in response
-            text = response_text.strip()
+            # Take the first balanced JSON object in the response
+            result = load_first_json(response_text, '{', '}')
+            return result if isinstance(result, dict) else None
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse LLM response as JSON: {e}")
+            return None
 
-            # Find JSON block
-            start_idx = text.find('{')
-            end_idx = text.rfind('}')
+    def _parse_llm_batch_response(self, response_text: str) -> Optional[List[Any]]:
+        """Parse a batched LLM response to extract the JSON result array.
 
-            if start_idx != -1 and end_idx != -1:
-                json_str = text[start_idx:end_idx + 1]
-                return json.loads(json_str)
+        Args:
+            response_text: Raw LLM response
 
-            return None
+        Returns:
+            Parsed list or None
+        """
+        try:
+            # Take the first balanced JSON array in the response
+            result = load_first_json(response_text, '[', ']')
+            return result if isinstance(result, list) else None
 
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse LLM response as JSON: {e}")
+            logger.warning(f"Failed to parse batched LLM response as JSON: {e}")
             return None
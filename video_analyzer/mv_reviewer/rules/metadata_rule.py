@@ -1,12 +1,16 @@
 """Rule 1: Blocked lyricist/composer detection."""
 
 import logging
-from typing import Optional, List, Dict, Any
+import re
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
 
 from .base_rule import BaseRule
 from ..models.review_result import RuleViolation, ReviewContext, SongMetadata
-from ..services.shazam_client import ShazamClient
-from ..services.musicbrainz_client import MusicBrainzClient
+from ..services.shazam_client import get_shazam_client
+from ..services.musicbrainz_client import get_musicbrainz_client
+from ..services.audio_cache import ensure_audio
+from ..services.result_cache import DEFAULT_CACHE_DIR, JsonCache, file_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,8 @@ class MetadataRule(BaseRule):
     rule_id = 1
     rule_name = "作词作曲检测"
     rule_description = "检测作词或作曲是否在黑名单中"
+    cost_hint = 3  # Shazam + rate-limited MusicBrainz requests
+    workload = 'io'
 
     # Default blocked creators
     DEFAULT_BLOCKED_CREATORS = ["林夕"]
@@ -29,15 +35,32 @@ class MetadataRule(BaseRule):
         """Initialize metadata rule.
 
         Args:
-            config: Configuration with optional 'blocked_creators' list
+            config: Configuration with optional 'blocked_creators' list and
+                'cache_dir' for identification and MusicBrainz lookups
+                (null disables)
         """
         super().__init__(config)
         self.blocked_creators = self.config.get(
             'blocked_creators',
             self.DEFAULT_BLOCKED_CREATORS
         )
-        self.shazam_client = ShazamClient()
-        self.musicbrainz_client = MusicBrainzClient()
+        # One alternation over all blocked names, used to reject the
+        # common no-match case in a single scan per creator string
+        self._blocked_pattern = re.compile(
+            '|'.join(re.escape(name.lower()) for name in self.blocked_creators)
+        ) if self.blocked_creators else None
+
+        cache_dir = self.config.get('cache_dir', DEFAULT_CACHE_DIR)
+
+        # Process-wide clients: one Shazam event loop and one MusicBrainz
+        # cache per directory, however many rule instances exist
+        self.shazam_client = get_shazam_client()
+        self.musicbrainz_client = get_musicbrainz_client(cache_dir)
+
+        # Shazam results keyed by video content, persisted across runs
+        self._shazam_cache = (
+            JsonCache(Path(cache_dir).expanduser() / "shazam.sqlite") if cache_dir else None
+        )
 
     def check(self, context: ReviewContext) -> Optional[RuleViolation]:
         """Check if song's lyricist/composer is in blocklist.
@@ -63,21 +86,21 @@ class MetadataRule(BaseRule):
             context.song_metadata = metadata
 
             # Check against blocklist
-            for blocked_name in self.blocked_creators:
-                if metadata.has_creator(blocked_name):
-                    matched_roles = self._get_matched_roles(metadata, blocked_name)
-                    return self.create_violation(
-                        description=f"检测到黑名单创作者: {blocked_name} ({', '.join(matched_roles)})",
-                        confidence=1.0,
-                        details={
-                            'blocked_creator': blocked_name,
-                            'matched_roles': matched_roles,
-                            'song_title': metadata.title,
-                            'song_artist': metadata.artist,
-                            'lyricist': metadata.lyricist,
-                            'composer': metadata.composer,
-                        }
-                    )
+            match = self._find_blocked_creator(metadata)
+            if match:
+                blocked_name, matched_roles = match
+                return self.create_violation(
+                    description=f"检测到黑名单创作者: {blocked_name} ({', '.join(matched_roles)})",
+                    confidence=1.0,
+                    details={
+                        'blocked_creator': blocked_name,
+                        'matched_roles': matched_roles,
+                        'song_title': metadata.title,
+                        'song_artist': metadata.artist,
+                        'lyricist': metadata.lyricist,
+                        'composer': metadata.composer,
+                    }
+                )
 
             return None
 
@@ -99,11 +122,7 @@ class MetadataRule(BaseRule):
             return context.song_metadata
 
         # Step 1: Identify song using Shazam
-        temp_dir = context.video_path.parent / ".mv_review_temp"
-        shazam_result = self.shazam_client.identify_from_video(
-            context.video_path,
-            temp_dir
-        )
+        shazam_result = self._identify_song(context)
 
         if not shazam_result:
             logger.warning("Shazam could not identify the song")
@@ -135,29 +154,67 @@ class MetadataRule(BaseRule):
                 composer=[],
             )
 
-    def _get_matched_roles(self, metadata: SongMetadata, name: str) -> List[str]:
-        """Get list of roles where the name was matched.
+    def _identify_song(self, context: ReviewContext) -> Optional[Dict[str, Any]]:
+        """Identify the song with Shazam, reusing cached results.
+
+        Args:
+            context: Review context
+
+        Returns:
+            Shazam result dictionary or None
+        """
+        key = None
+        if self._shazam_cache is not None:
+            try:
+                key = file_fingerprint(context.video_path)
+            except OSError as e:
+                logger.warning(f"Could not fingerprint video: {e}")
+
+        if key is not None:
+            cached = self._shazam_cache.get(key)
+            if cached is not None:
+                logger.info("Using cached Shazam result")
+                return cached
+
+        # Reuse audio already decoded on the context (e.g. by the volume
+        # rule); otherwise decode just the start of the track
+        if context.audio_samples is not None:
+            if not ensure_audio(context):
+                return None
+            result = self.shazam_client.identify_samples(
+                context.audio_samples,
+                context.audio_sample_rate,
+                context.temp_dir
+            )
+        else:
+            result = self.shazam_client.identify_from_video(
+                context.video_path,
+                context.temp_dir
+            )
+
+        # Only successful identifications are cached, failures are retried
+        if result and key is not None:
+            self._shazam_cache.set(key, result)
+
+        return result
+
+    def _find_blocked_creator(self, metadata: SongMetadata) -> Optional[Tuple[str, List[str]]]:
+        """Find the first blocked creator (in blocklist order) in the metadata.
 
         Args:
             metadata: Song metadata
-            name: Creator name to check
 
         Returns:
-            List of matched roles (e.g., ['作词', '作曲'])
+            Tuple of (blocked name, matched roles), or None if no match
         """
-        roles = []
-        name_lower = name.lower()
-
-        if metadata.lyricist:
-            for l in metadata.lyricist:
-                if name_lower in l.lower():
-                    roles.append('作词')
-                    break
-
-        if metadata.composer:
-            for c in metadata.composer:
-                if name_lower in c.lower():
-                    roles.append('作曲')
-                    break
-
-        return roles
+        if self._blocked_pattern is None:
+            return None
+
+        if not any(self._blocked_pattern.search(c) for c in metadata.iter_creators_lower()):
+            return None
+
+        for blocked_name in self.blocked_creators:
+            if metadata.has_creator(blocked_name):
+                return blocked_name, metadata.matched_roles(blocked_name)
+
+        return None
@@ -1,12 +1,13 @@
 """Rule 3: Volume spike detection."""
 
 import logging
-import subprocess
-from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any
+
+import numpy as np
 
 from .base_rule import BaseRule
 from ..models.review_result import RuleViolation, ReviewContext
+from ..services.audio_cache import ensure_audio
 
 logger = logging.getLogger(__name__)
 
@@ -18,23 +19,33 @@ class VolumeRule(BaseRule):
     - Sudden volume increases
     - Sudden volume decreases
     - Overall volume too high or too low
+
+    Segment levels are RMS loudness by default. With level_mode 'peak'
+    the sample peak of each segment is used instead, which is cheaper to
+    compute but follows transients rather than perceived loudness.
     """
 
     rule_id = 3
     rule_name = "音量突变检测"
     rule_description = "检测音量突然变大或变小"
+    cost_hint = 2  # full audio decode
 
     # Default thresholds
     DEFAULT_CHANGE_THRESHOLD_DB = 10.0  # dB change to trigger
     DEFAULT_SEGMENT_DURATION_MS = 1000  # Analyze in 1-second segments
     DEFAULT_MIN_VOLUME_DB = -40.0       # Below this is too quiet
     DEFAULT_MAX_VOLUME_DB = -3.0        # Above this is too loud
+    DEFAULT_LEVEL_MODE = 'rms'          # Segment level: 'rms' or 'peak'
+
+    # Segments below this level are treated as silence and never form spikes
+    SILENCE_DB = -55.0
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize volume rule.
 
         Args:
-            config: Configuration with optional thresholds
+            config: Configuration with optional thresholds and 'level_mode'
+                ('rms' or 'peak')
         """
         super().__init__(config)
         self.change_threshold_db = self.config.get(
@@ -53,6 +64,10 @@ class VolumeRule(BaseRule):
             'max_volume_db',
             self.DEFAULT_MAX_VOLUME_DB
         )
+        self.level_mode = self.config.get('level_mode', self.DEFAULT_LEVEL_MODE)
+        if self.level_mode not in ('rms', 'peak'):
+            logger.warning(f"Unknown level_mode '{self.level_mode}', using 'rms'")
+            self.level_mode = 'rms'
 
     def check(self, context: ReviewContext) -> Optional[RuleViolation]:
         """Check for volume spikes or drops.
@@ -67,15 +82,25 @@ class VolumeRule(BaseRule):
             return None
 
         try:
-            # Extract audio if not already done
-            audio_path = self._ensure_audio(context)
-            if audio_path is None:
+            # Decode audio if not already done (shared with other rules)
+            if not ensure_audio(context):
                 logger.warning("No audio available for volume analysis")
                 return None
 
-            # Analyze volume levels
-            volume_data = self._analyze_volume(audio_path)
-            if not volume_data:
+            # No segment level (RMS or peak) can exceed the track's peak, so
+            # an entirely silent track can't contain a spike
+            if context._volume_data is None and self._is_silent(context.audio_samples):
+                logger.info("Audio is silent, skipping volume analysis")
+                return None
+
+            # Analyze volume levels (cached on context)
+            if context._volume_data is None:
+                context._volume_data = self._analyze_volume(
+                    context.audio_samples, context.audio_sample_rate
+                )
+
+            volume_data = context._volume_data
+            if not len(volume_data):
                 return None
 
             # Check for volume spikes
@@ -100,107 +125,117 @@ class VolumeRule(BaseRule):
             logger.error(f"Error in volume rule check: {e}")
             return None
 
-    def _ensure_audio(self, context: ReviewContext) -> Optional[Path]:
-        """Ensure audio file exists, extract if needed.
+    def _is_silent(self, samples: np.ndarray) -> bool:
+        """Check whether every sample stays below the silence level.
 
         Args:
-            context: Review context
+            samples: Mono 16-bit PCM samples
 
         Returns:
-            Path to audio file or None
+            True if the peak amplitude is below SILENCE_DB
         """
-        if context.audio_path and context.audio_path.exists():
-            return context.audio_path
+        peak = max(int(samples.max()), -int(samples.min()))
+        return peak < 32768.0 * 10 ** (self.SILENCE_DB / 20)
 
-        # Extract audio from video
-        temp_dir = context.video_path.parent / ".mv_review_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        audio_path = temp_dir / "audio_for_volume.wav"
-
-        try:
-            subprocess.run([
-                "ffmpeg", "-i", str(context.video_path),
-                "-vn",
-                "-acodec", "pcm_s16le",
-                "-ar", "16000",
-                "-ac", "1",
-                "-y",
-                str(audio_path)
-            ], check=True, capture_output=True)
-
-            context.audio_path = audio_path
-            return audio_path
-
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error: {e.stderr.decode()}")
-            return None
-
-    def _analyze_volume(self, audio_path: Path) -> List[Tuple[float, float]]:
+    def _analyze_volume(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
         """Analyze volume levels throughout the audio.
 
+        The PCM samples are split into segments and the level (RMS or
+        peak, see level_mode) of all segments is computed in one
+        vectorized pass.
+
         Args:
-            audio_path: Path to audio file
+            samples: Mono 16-bit PCM samples
+            sample_rate: Sample rate in Hz
 
         Returns:
-            List of (timestamp, volume_db) tuples
+            Array of shape (segments, 2) holding (timestamp, volume_db) rows
         """
-        try:
-            from pydub import AudioSegment
-
-            audio = AudioSegment.from_wav(str(audio_path))
-            duration_ms = len(audio)
-
-            volume_data = []
-            for start_ms in range(0, duration_ms, self.segment_duration_ms):
-                end_ms = min(start_ms + self.segment_duration_ms, duration_ms)
-                segment = audio[start_ms:end_ms]
-
-                # Get dBFS (decibels relative to full scale)
-                volume_db = segment.dBFS if segment.dBFS != float('-inf') else -60.0
-
-                timestamp = start_ms / 1000.0
-                volume_data.append((timestamp, volume_db))
+        segment_len = max(1, int(self.segment_duration_ms * sample_rate / 1000))
+        full_len = len(samples) // segment_len * segment_len
+
+        if self.level_mode == 'peak':
+            amplitude = self._segment_peaks(samples, segment_len, full_len)
+        else:
+            amplitude = self._segment_rms(samples, segment_len, full_len)
+
+        # dBFS (decibels relative to full scale); silence is reported as -60
+        with np.errstate(divide='ignore'):
+            volume_db = 20 * np.log10(amplitude / 32768.0)
+        volume_db = np.where(np.isfinite(volume_db), volume_db, -60.0)
+
+        timestamps = np.arange(len(volume_db)) * self.segment_duration_ms / 1000.0
+        return np.column_stack((timestamps, volume_db))
+
+    @staticmethod
+    def _segment_rms(samples: np.ndarray, segment_len: int, full_len: int) -> np.ndarray:
+        """RMS amplitude of each segment (full segments, then the tail)."""
+        # Mean square per segment (full segments, then the shorter tail).
+        # einsum squares and sums the int16 samples in one pass, casting to
+        # float32 in small buffers instead of materializing a float copy;
+        # int32 accumulation would overflow on loud segments.
+        segments = samples[:full_len].reshape(-1, segment_len)
+        mean_square = np.einsum('ij,ij->i', segments, segments, dtype=np.float32) / segment_len
+
+        tail = samples[full_len:]
+        if len(tail):
+            mean_square = np.append(
+                mean_square, np.einsum('i,i->', tail, tail, dtype=np.float32) / len(tail)
+            )
+
+        return np.sqrt(mean_square)
+
+    @staticmethod
+    def _segment_peaks(samples: np.ndarray, segment_len: int, full_len: int) -> np.ndarray:
+        """Peak amplitude of each segment (full segments, then the tail)."""
+        # max/min reductions stay in int16; np.abs would overflow on -32768
+        # and need a widened copy of every sample
+        segments = samples[:full_len].reshape(-1, segment_len)
+        peaks = np.maximum(
+            segments.max(axis=1).astype(np.int32),
+            -segments.min(axis=1).astype(np.int32)
+        )
 
-            return volume_data
+        tail = samples[full_len:]
+        if len(tail):
+            peaks = np.append(peaks, max(int(tail.max()), -int(tail.min())))
 
-        except ImportError:
-            logger.error("pydub is required for volume analysis")
-            return []
-        except Exception as e:
-            logger.error(f"Error analyzing volume: {e}")
-            return []
+        return peaks
 
-    def _detect_volume_spikes(
-        self,
-        volume_data: List[Tuple[float, float]]
-    ) -> List[Dict[str, Any]]:
+    def _detect_volume_spikes(self, volume_data: np.ndarray) -> List[Dict[str, Any]]:
         """Detect sudden volume changes.
 
+        Compares each segment with the previous one using array
+        operations; dictionaries are only built for the detected spikes.
+
         Args:
-            volume_data: List of (timestamp, volume_db) tuples
+            volume_data: Array of (timestamp, volume_db) rows
 
         Returns:
             List of spike information dictionaries
         """
-        spikes = []
-
-        for i in range(1, len(volume_data)):
-            prev_time, prev_vol = volume_data[i - 1]
-            curr_time, curr_vol = volume_data[i]
-
-            # Skip if either is silence
-            if prev_vol < -55 or curr_vol < -55:
-                continue
-
-            change = curr_vol - prev_vol
-
-            if abs(change) >= self.change_threshold_db:
-                spikes.append({
-                    'time': curr_time,
-                    'change': change,
-                    'from_db': prev_vol,
-                    'to_db': curr_vol,
-                    'type': 'increase' if change > 0 else 'decrease'
-                })
-
-        return spikes
+        times = volume_data[:, 0]
+        volumes = volume_data[:, 1]
+
+        changes = np.diff(volumes)
+
+        # Skip pairs where either segment is silence
+        audible = volumes >= self.SILENCE_DB
+        mask = audible[:-1] & audible[1:] & (np.abs(changes) >= self.change_threshold_db)
+        indices = np.flatnonzero(mask)
+
+        return [
+            {
+                'time': time,
+                'change': change,
+                'from_db': from_db,
+                'to_db': to_db,
+                'type': 'increase' if change > 0 else 'decrease'
+            }
+            for time, change, from_db, to_db in zip(
+                times[indices + 1].tolist(),
+                changes[indices].tolist(),
+                volumes[indices].tolist(),
+                volumes[indices + 1].tolist()
+            )
+        ]
@@ -1,6 +1,29 @@
 """External services for MV review."""
 
-from .shazam_client import ShazamClient
-from .musicbrainz_client import MusicBrainzClient
+from .shazam_client import ShazamClient, get_shazam_client
+from .musicbrainz_client import MusicBrainzClient, get_musicbrainz_client
+from .audio_cache import load_audio, read_wav, write_wav, ensure_audio
+from .result_cache import JsonCache, file_fingerprint
+from .video_probe import (
+    probe_video, read_first_frame, ensure_probed, ensure_first_frame,
+    extract_sample_frames, opened_capture
+)
 
-__all__ = ['ShazamClient', 'MusicBrainzClient']
+__all__ = [
+    'ShazamClient',
+    'get_shazam_client',
+    'MusicBrainzClient',
+    'get_musicbrainz_client',
+    'load_audio',
+    'read_wav',
+    'write_wav',
+    'ensure_audio',
+    'JsonCache',
+    'file_fingerprint',
+    'probe_video',
+    'read_first_frame',
+    'ensure_probed',
+    'ensure_first_frame',
+    'extract_sample_frames',
+    'opened_capture'
+]
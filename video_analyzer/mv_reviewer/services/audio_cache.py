@@ -0,0 +1,147 @@
+"""Audio decoding shared by all review rules (one ffmpeg decode per video)."""
+
+import logging
+import subprocess
+import wave
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..models.review_result import ReviewContext
+
+logger = logging.getLogger(__name__)
+
+# Audio is decoded to 16-bit mono PCM at this rate. It is enough for
+# loudness analysis and is the rate Shazam fingerprints at.
+AUDIO_SAMPLE_RATE = 16000
+
+
+def load_audio(
+    video_path: Path,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    duration: Optional[float] = None
+) -> Optional[np.ndarray]:
+    """Decode the audio track with ffmpeg straight into memory.
+
+    ffmpeg writes raw PCM to a pipe, so no WAV file touches the disk.
+
+    Args:
+        video_path: Path to video file
+        sample_rate: Output sample rate in Hz
+        duration: Only decode this many seconds from the start
+
+    Returns:
+        Mono int16 samples, or None if the video has no decodable audio
+    """
+    # -nostdin keeps ffmpeg from reading the terminal of the calling CLI;
+    # with -nostats and -loglevel error stderr only carries real errors
+    command = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error",
+        "-i", str(video_path),
+        "-vn",
+    ]
+    if duration is not None:
+        command += ["-t", str(duration)]
+    command += [
+        "-f", "s16le",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "-ac", "1",
+        "-"
+    ]
+
+    try:
+        result = subprocess.run(
+            command, check=True, stdin=subprocess.DEVNULL, capture_output=True
+        )
+    except subprocess.CalledProcessError as e:
+        logger.error(f"FFmpeg error: {e.stderr.decode()}")
+        return None
+    except OSError as e:
+        logger.error(f"Could not run ffmpeg: {e}")
+        return None
+
+    return np.frombuffer(result.stdout, dtype=np.int16)
+
+
+def read_wav(audio_path: Path) -> Tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV file into a mono int16 array.
+
+    Args:
+        audio_path: Path to WAV file
+
+    Returns:
+        Tuple of (samples, sample rate); multi-channel audio is averaged
+
+    Raises:
+        ValueError: If the file is not 16-bit PCM
+    """
+    with wave.open(str(audio_path), 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"Expected 16-bit PCM, got {wav.getsampwidth() * 8}-bit")
+        sample_rate = wav.getframerate()
+        channels = wav.getnchannels()
+        raw = wav.readframes(wav.getnframes())
+
+    samples = np.frombuffer(raw, dtype=np.int16)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+
+    return samples, sample_rate
+
+
+def write_wav(audio_path: Path, samples: np.ndarray, sample_rate: int):
+    """Write mono int16 samples as a 16-bit PCM WAV file.
+
+    Args:
+        audio_path: Output path
+        samples: Mono int16 samples
+        sample_rate: Sample rate in Hz
+    """
+    with wave.open(str(audio_path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(np.ascontiguousarray(samples, dtype=np.int16).tobytes())
+
+
+def ensure_audio(context: ReviewContext) -> bool:
+    """Decode the audio track once and cache the samples on the context.
+
+    A pre-extracted WAV (context.audio_path) is read instead of decoding
+    the video. Safe to call from every rule, including concurrently; only
+    the first call decodes.
+
+    Args:
+        context: Review context
+
+    Returns:
+        True if audio samples are available on the context
+    """
+    if context.audio_samples is None:
+        with context._audio_lock:
+            if context.audio_samples is None:
+                _decode_into(context)
+
+    return len(context.audio_samples) > 0
+
+
+def _decode_into(context: ReviewContext):
+    """Decode the audio and publish it on the context (lock held)."""
+    samples = None
+    sample_rate = AUDIO_SAMPLE_RATE
+
+    if context.audio_path and context.audio_path.exists():
+        try:
+            samples, sample_rate = read_wav(context.audio_path)
+        except (OSError, EOFError, wave.Error, ValueError) as e:
+            logger.error(f"Error reading audio file: {e}")
+    else:
+        samples = load_audio(context.video_path, sample_rate)
+
+    # The rate goes first: readers check audio_samples without the lock,
+    # so once it is set the matching rate must already be in place.
+    # An empty array marks "no audio" so the decode isn't retried.
+    context.audio_sample_rate = sample_rate
+    context.audio_samples = samples if samples is not None else np.empty(0, np.int16)
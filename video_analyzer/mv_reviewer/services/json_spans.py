@@ -0,0 +1,69 @@
+"""Extraction of JSON values embedded in free-form (LLM) text."""
+
+import json
+from typing import Any, Iterator
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, stdlib json is used instead
+    _json_loads = json.loads
+
+
+def iter_json_spans(text: str, open_char: str, close_char: str) -> Iterator[str]:
+    """Yield top-level balanced ``open_char ... close_char`` spans of text.
+
+    Single pass over the text; brackets inside JSON strings are ignored,
+    so a response like ``{...} Note: {...}`` yields each object separately.
+
+    Args:
+        text: Raw LLM response
+        open_char: '{' for objects, '[' for arrays
+        close_char: '}' for objects, ']' for arrays
+
+    Yields:
+        Candidate JSON substrings in order of appearance
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = depth > 0
+        elif char == open_char:
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == close_char and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+
+def load_first_json(text: str, open_char: str, close_char: str) -> Any:
+    """Parse the first top-level JSON span of text that is valid JSON.
+
+    Returns:
+        Parsed value, or None if no span parses
+
+    Raises:
+        json.JSONDecodeError: If spans were found but none is valid JSON
+    """
+    error = None
+    for span in iter_json_spans(text, open_char, close_char):
+        try:
+            return _json_loads(span)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+            error = error or e
+    if error is not None:
+        raise error
+    return None
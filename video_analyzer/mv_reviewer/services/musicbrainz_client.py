@@ -1,7 +1,15 @@
 """MusicBrainz client for fetching song metadata (lyricist, composer)."""
 
 import logging
-from typing import Optional, List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
+
+import requests
+
+from .rate_limit import RequestGate, SharedLookups
+from .result_cache import JsonCache
 
 logger = logging.getLogger(__name__)
 
@@ -10,27 +18,102 @@ APP_NAME = "MVReviewer"
 APP_VERSION = "0.1.0"
 APP_CONTACT = "mv-reviewer@example.com"
 
+# MusicBrainz web service (JSON responses via fmt=json)
+API_URL = "https://musicbrainz.org/ws/2"
+REQUEST_TIMEOUT = 30  # seconds
+
+# MusicBrainz allows one request per second per client IP
+REQUEST_INTERVAL = 1.0
+
+# Attempts per request; MusicBrainz answers 503 when it is rate limiting
+MAX_ATTEMPTS = 3
+
+# Recordings whose credits are fetched concurrently
+MAX_WORKERS = 2
+
+# Credit roles for each MusicBrainz work-artist relation type; a writer
+# wrote both lyrics and music
+_ROLE_MAP = {
+    'lyricist': ('lyricist',),
+    'lyrics': ('lyricist',),
+    'composer': ('composer',),
+    'music': ('composer',),
+    'writer': ('lyricist', 'composer'),
+}
+
+
+# Shared by all clients since the limit is per IP
+_request_gate = RequestGate(REQUEST_INTERVAL)
+
+
+def use_shared_request_gate(shared_state: Any):
+    """Space this process's requests together with other processes.
+
+    Called in each process pool worker so that N workers still send one
+    request per REQUEST_INTERVAL in total rather than N.
+
+    Args:
+        shared_state: Value from rate_limit.shared_gate_state()
+    """
+    global _request_gate
+    _request_gate = RequestGate(REQUEST_INTERVAL, shared_state)
+
 
 class MusicBrainzClient:
-    """Client for querying MusicBrainz metadata API."""
-
-    def __init__(self):
-        """Initialize MusicBrainz client."""
-        self._mb = None
-
-    def _get_mb(self):
-        """Lazy load musicbrainzngs to avoid import errors."""
-        if self._mb is None:
-            try:
-                import musicbrainzngs
-                musicbrainzngs.set_useragent(APP_NAME, APP_VERSION, APP_CONTACT)
-                self._mb = musicbrainzngs
-            except ImportError:
-                raise ImportError(
-                    "musicbrainzngs is required for metadata lookup. "
-                    "Install it with: pip install musicbrainzngs"
-                )
-        return self._mb
+    """Client for querying MusicBrainz metadata API.
+
+    Talks to the WS/2 JSON API over one keep-alive requests.Session, so
+    consecutive lookups reuse the TLS connection. Instances may be shared
+    between threads (the session's connection pool is thread-safe and
+    request starts are spaced by the shared _request_gate); use
+    get_musicbrainz_client to share one instance (and its cache) per
+    process.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize MusicBrainz client.
+
+        Args:
+            cache_dir: Directory for the on-disk lookup cache (None disables)
+        """
+        # Credits keyed by recording/work ID, persisted across runs so
+        # repeat reviews skip the rate-limited API entirely
+        self._cache = (
+            JsonCache(Path(cache_dir).expanduser() / "musicbrainz.sqlite") if cache_dir else None
+        )
+
+        # Reuse connections (and TLS sessions) across requests
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': f"{APP_NAME}/{APP_VERSION} ( {APP_CONTACT} )",
+            'Accept': 'application/json',
+        })
+
+    def _get(self, path: str, **params) -> Dict[str, Any]:
+        """GET a WS/2 resource within the rate limit.
+
+        Args:
+            path: Resource path below API_URL (e.g. 'work/<id>')
+            **params: Query parameters
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        params['fmt'] = 'json'
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            _request_gate.wait()
+            response = self.session.get(
+                f"{API_URL}/{path}", params=params, timeout=REQUEST_TIMEOUT
+            )
+            if response.status_code != 503 or attempt == MAX_ATTEMPTS:
+                break
+            logger.info(f"MusicBrainz busy, retrying ({attempt}/{MAX_ATTEMPTS})")
+
+        response.raise_for_status()
+        return response.json()
 
     def search_recording(
         self,
@@ -49,102 +132,140 @@ class MusicBrainzClient:
             List of matching recordings or None
         """
         try:
-            mb = self._get_mb()
-
             query = f'recording:"{title}"'
             if artist:
                 query += f' AND artist:"{artist}"'
 
-            result = mb.search_recordings(query=query, limit=limit)
-
-            if not result or 'recording-list' not in result:
+            recordings = self._get('recording', query=query, limit=limit).get('recordings')
+            if not recordings:
                 return None
 
-            return result['recording-list']
+            # Flatten the artist credit the way it is displayed
+            for rec in recordings:
+                rec['artist-credit-phrase'] = ''.join(
+                    credit.get('name', '') + credit.get('joinphrase', '')
+                    for credit in rec.get('artist-credit', [])
+                )
+
+            return recordings
 
         except Exception as e:
             logger.error(f"Error searching MusicBrainz: {e}")
             return None
 
-    def get_work_credits(self, recording_id: str) -> Dict[str, List[str]]:
+    def get_work_credits(
+        self,
+        recording_id: str,
+        work_lookups: Optional[SharedLookups] = None
+    ) -> Dict[str, List[str]]:
         """Get lyricist and composer credits for a recording.
 
         Args:
             recording_id: MusicBrainz recording ID
+            work_lookups: Work lookups shared with other recordings of the
+                same song, so each work is fetched once
 
         Returns:
             Dictionary with 'lyricist' and 'composer' lists
         """
-        credits = {'lyricist': [], 'composer': []}
+        credits, _ = self._get_recording_credits(recording_id, work_lookups)
+        return credits
 
-        try:
-            mb = self._get_mb()
+    def _get_recording_credits(
+        self,
+        recording_id: str,
+        work_lookups: Optional[SharedLookups] = None
+    ) -> Tuple[Dict[str, List[str]], bool]:
+        """Get credits for a recording and whether every lookup succeeded.
 
-            # Get recording with work relations
-            recording = mb.get_recording_by_id(
-                recording_id,
-                includes=['work-rels', 'artist-credits']
-            )
+        Args:
+            recording_id: MusicBrainz recording ID
+            work_lookups: Shared work lookups (see get_work_credits)
 
-            if not recording or 'recording' not in recording:
-                return credits
+        Returns:
+            Tuple of (credits, complete); incomplete credits may be missing
+            names because the recording or one of its works failed to load
+        """
+        cache_key = f"recording:{recording_id}"
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached, True
 
-            rec = recording['recording']
+        # Names collected across works; dicts act as insertion-ordered sets
+        lyricists: Dict[str, None] = {}
+        composers: Dict[str, None] = {}
 
-            # Check work relations for credits
-            if 'work-relation-list' in rec:
-                for work_rel in rec['work-relation-list']:
-                    if 'work' in work_rel:
-                        work_id = work_rel['work']['id']
-                        work_credits = self._get_work_artists(work_id)
-                        credits['lyricist'].extend(work_credits.get('lyricist', []))
-                        credits['composer'].extend(work_credits.get('composer', []))
+        # Only complete lookups are cached: failed works may hide credits
+        complete = True
 
-            # Remove duplicates
-            credits['lyricist'] = list(set(credits['lyricist']))
-            credits['composer'] = list(set(credits['composer']))
+        try:
+            # Get recording with work relations
+            rec = self._get(f"recording/{recording_id}", inc='work-rels')
 
-            return credits
+            # Check work relations for credits
+            for work_rel in rec.get('relations', []):
+                if 'work' in work_rel:
+                    work_id = work_rel['work']['id']
+                    if work_lookups is not None:
+                        work_credits = work_lookups.get(work_id, self._get_work_artists)
+                    else:
+                        work_credits = self._get_work_artists(work_id)
+                    if work_credits is None:
+                        complete = False
+                        continue
+                    lyricists.update(dict.fromkeys(work_credits.get('lyricist', [])))
+                    composers.update(dict.fromkeys(work_credits.get('composer', [])))
 
         except Exception as e:
             logger.error(f"Error getting work credits: {e}")
-            return credits
+            complete = False
+
+        credits = {'lyricist': list(lyricists), 'composer': list(composers)}
 
-    def _get_work_artists(self, work_id: str) -> Dict[str, List[str]]:
+        if self._cache is not None and complete:
+            self._cache.set(cache_key, credits)
+
+        return credits, complete
+
+    def _get_work_artists(self, work_id: str) -> Optional[Dict[str, List[str]]]:
         """Get artists associated with a work (lyricist, composer).
 
         Args:
             work_id: MusicBrainz work ID
 
         Returns:
-            Dictionary with 'lyricist' and 'composer' lists
+            Dictionary with 'lyricist' and 'composer' lists, or None if the
+            lookup failed
         """
+        cache_key = f"work:{work_id}"
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         credits = {'lyricist': [], 'composer': []}
 
         try:
-            mb = self._get_mb()
-            work = mb.get_work_by_id(work_id, includes=['artist-rels'])
+            work = self._get(f"work/{work_id}", inc='artist-rels')
 
-            if not work or 'work' not in work:
-                return credits
+            for rel in work.get('relations', []):
+                roles = _ROLE_MAP.get(rel.get('type', '').lower())
+                if roles is None or 'artist' not in rel:
+                    continue
 
-            w = work['work']
+                artist_name = rel['artist'].get('name', '')
+                for role in roles:
+                    credits[role].append(artist_name)
 
-            if 'artist-relation-list' in w:
-                for rel in w['artist-relation-list']:
-                    artist_name = rel.get('artist', {}).get('name', '')
-                    rel_type = rel.get('type', '').lower()
-
-                    if rel_type in ['lyricist', 'writer', 'lyrics']:
-                        credits['lyricist'].append(artist_name)
-                    elif rel_type in ['composer', 'music', 'writer']:
-                        credits['composer'].append(artist_name)
+            if self._cache is not None:
+                self._cache.set(cache_key, credits)
 
             return credits
 
         except Exception as e:
             logger.debug(f"Error getting work artists: {e}")
-            return credits
+            return None
 
     def get_song_metadata(
         self,
@@ -160,38 +281,116 @@ class MusicBrainzClient:
         Returns:
             Dictionary with song metadata or None
         """
+        # Same song under different casing/spacing shares one entry
+        cache_key = f"song:{title.strip().lower()}\n{(artist or '').strip().lower()}"
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        metadata, complete = self._lookup_song_metadata(title, artist)
+
+        # Only answers built from successful lookups are stored; anything
+        # else is retried (cheaply, via the recording/work entries) next
+        # time. Stored answers expire with the cache TTL, so later edits
+        # on MusicBrainz are picked up eventually.
+        if self._cache is not None and metadata and complete:
+            self._cache.set(cache_key, metadata)
+
+        return metadata
+
+    def _lookup_song_metadata(
+        self,
+        title: str,
+        artist: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Query MusicBrainz for song metadata, bypassing the song cache.
+
+        Returns:
+            Tuple of (metadata or None, complete); complete is False if any
+            lookup the answer depends on failed
+        """
         recordings = self.search_recording(title, artist)
 
         if not recordings:
             logger.warning(f"No recordings found for: {title} - {artist}")
-            return None
+            return None, False
+
+        # Fetch credits for several recordings at once and take the first
+        # one, in search order, whose credits loaded completely. Recordings
+        # of one song usually share works, so each work is fetched once.
+        work_lookups = SharedLookups()
+        candidates = [rec for rec in recordings if rec.get('id')]
 
-        # Try each recording until we find credits
-        for rec in recordings:
-            rec_id = rec.get('id')
-            if not rec_id:
-                continue
-
-            credits = self.get_work_credits(rec_id)
-
-            # If we found any credits, return this result
-            if credits['lyricist'] or credits['composer']:
-                return {
-                    'title': rec.get('title'),
-                    'artist': rec.get('artist-credit-phrase', artist),
-                    'musicbrainz_id': rec_id,
-                    'lyricist': credits['lyricist'],
-                    'composer': credits['composer'],
-                    'release_date': rec.get('first-release-date'),
-                }
+        # A partial result is only used if no recording loads completely
+        fallback = None
+        all_complete = True
+
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        try:
+            futures = [
+                executor.submit(self._get_recording_credits, rec['id'], work_lookups)
+                for rec in candidates
+            ]
+
+            for rec, future in zip(candidates, futures):
+                credits, complete = future.result()
+                all_complete = all_complete and complete
+
+                if not (credits['lyricist'] or credits['composer']):
+                    continue
+                if complete:
+                    return _song_metadata(rec, credits, artist), all_complete
+                if fallback is None:
+                    fallback = _song_metadata(rec, credits, artist)
+        finally:
+            # Don't start lookups for recordings that are no longer needed
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if fallback is not None:
+            return fallback, False
 
         # Return first result even without credits
-        first = recordings[0]
-        return {
-            'title': first.get('title'),
-            'artist': first.get('artist-credit-phrase', artist),
-            'musicbrainz_id': first.get('id'),
-            'lyricist': [],
-            'composer': [],
-            'release_date': first.get('first-release-date'),
-        }
+        empty = {'lyricist': [], 'composer': []}
+        return _song_metadata(recordings[0], empty, artist), all_complete
+
+
+def _song_metadata(
+    rec: Dict[str, Any],
+    credits: Dict[str, List[str]],
+    artist: Optional[str]
+) -> Dict[str, Any]:
+    """Build the song metadata dict for a recording and its credits."""
+    return {
+        'title': rec.get('title'),
+        'artist': rec.get('artist-credit-phrase', artist),
+        'musicbrainz_id': rec.get('id'),
+        'lyricist': credits['lyricist'],
+        'composer': credits['composer'],
+        'release_date': rec.get('first-release-date'),
+    }
+
+
+# Clients shared within the process, one per cache directory
+_clients: Dict[Optional[str], MusicBrainzClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_musicbrainz_client(cache_dir: Optional[Path] = None) -> MusicBrainzClient:
+    """Get the process-wide client for a cache directory.
+
+    Sharing the instance also shares its JsonCache, so rules writing the
+    same cache file don't overwrite each other's entries.
+
+    Args:
+        cache_dir: Directory for the on-disk lookup cache (None disables)
+
+    Returns:
+        Shared MusicBrainzClient
+    """
+    key = str(Path(cache_dir).expanduser()) if cache_dir else None
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = MusicBrainzClient(cache_dir)
+        return client
@@ -0,0 +1,92 @@
+"""Request spacing and deduplication for rate-limited web services."""
+
+import ctypes
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+
+class RequestGate:
+    """Spaces request starts a fixed interval apart.
+
+    The lock is not held while a request is in flight, so the latency of
+    concurrent requests overlaps while the start rate stays within the
+    API limit.
+
+    By default the gate covers the threads of one process. Gates built on
+    the same shared_gate_state() value also coordinate with each other
+    across processes (e.g. process pool workers), since time.monotonic is
+    a system-wide clock.
+    """
+
+    def __init__(self, interval: float, shared_state: Optional[Any] = None):
+        """Initialize the gate.
+
+        Args:
+            interval: Minimum seconds between request starts
+            shared_state: Value from shared_gate_state() to coordinate
+                with other processes (None for this process only)
+        """
+        self.interval = interval
+        if shared_state is not None:
+            self._lock = shared_state.get_lock()
+            self._next_start = shared_state
+        else:
+            self._lock = threading.Lock()
+            self._next_start = ctypes.c_double(0.0)
+
+    def wait(self):
+        """Block until the caller may start its request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.value)
+            self._next_start.value = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def shared_gate_state(context: Optional[Any] = None) -> Any:
+    """Create gate state that can be handed to child processes.
+
+    The value must reach the children through process creation, e.g. as
+    a ProcessPoolExecutor initializer argument.
+
+    Args:
+        context: multiprocessing context the children are started with
+            (None for the default context)
+
+    Returns:
+        Process-shared double holding the next allowed start time
+    """
+    return (context or multiprocessing.get_context()).Value('d', 0.0)
+
+
+class SharedLookups:
+    """Lookups shared by concurrent callers, each key fetched at most once.
+
+    The first caller to need a key fetches it; callers arriving while
+    that fetch is in flight wait for its result instead of requesting
+    the key again. Used for the works shared by recordings of one song.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+
+    def get(self, key: str, fetch: Callable[[str], Any]) -> Any:
+        """Return fetch(key), running it at most once per key."""
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+
+        if owner:
+            try:
+                future.set_result(fetch(key))
+            except Exception as e:
+                future.set_exception(e)
+
+        return future.result()
@@ -0,0 +1,127 @@
+"""Persistent caches for network lookups (Shazam, MusicBrainz)."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location of the on-disk caches
+DEFAULT_CACHE_DIR = Path("~/.cache/mv_reviewer").expanduser()
+
+# Bytes of the file hashed by file_fingerprint
+FINGERPRINT_BYTES = 1 << 20
+
+# Entries older than this are ignored and purged (seconds)
+DEFAULT_CACHE_TTL = 30 * 24 * 3600
+
+
+def file_fingerprint(path: Path) -> str:
+    """Build a content-based cache key for a media file.
+
+    Hashes the file size and its first MiB, so the key survives renames
+    and moves (e.g. into the violation directory) without reading the
+    whole file.
+
+    Args:
+        path: Path to file
+
+    Returns:
+        Hex digest identifying the file content
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        digest.update(str(os.fstat(f.fileno()).st_size).encode())
+        digest.update(f.read(FINGERPRINT_BYTES))
+    return digest.hexdigest()
+
+
+class JsonCache:
+    """Key/value cache of JSON values persisted in a SQLite database.
+
+    Every set() is a single-row upsert, so threads and worker processes
+    sharing the file never drop each other's entries, and a write costs
+    the same however large the cache grows. Entries older than ``ttl``
+    seconds are ignored on read and purged when the database is opened.
+    Failures to read or write the database are logged and otherwise
+    ignored.
+    """
+
+    def __init__(self, path: Path, ttl: Optional[float] = DEFAULT_CACHE_TTL):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database backing the cache
+            ttl: Maximum entry age in seconds, None to keep entries forever
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database for this process (caller holds the lock)."""
+        # A connection inherited through fork must not be used by the child
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            if self.ttl is not None:
+                conn.execute("DELETE FROM cache WHERE stored_at < ?", (time.time() - self.ttl,))
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value, stored_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Could not read cache {self.path}: {e}")
+                return None
+
+        if row is None:
+            return None
+        if self.ttl is not None and row[1] < time.time() - self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        """Store a value and persist it.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            try:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO cache (key, value, stored_at) VALUES (?, ?, ?)",
+                    (key, data, time.time())
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Could not write cache {self.path}: {e}")
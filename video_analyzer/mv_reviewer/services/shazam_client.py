@@ -3,35 +3,75 @@
 import asyncio
 import logging
 import platform
+import threading
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+import numpy as np
+
+from .audio_cache import AUDIO_SAMPLE_RATE, load_audio, write_wav
+
 logger = logging.getLogger(__name__)
 
 # Windows asyncio compatibility
 if platform.system() == 'Windows':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+# Seconds to wait for a single identification
+IDENTIFY_TIMEOUT = 60
+
+# Seconds of audio sent for identification, from the start of the video.
+# Long enough to get past a quiet or spoken intro; how much of the clip
+# shazamio actually fingerprints depends on its version.
+SHAZAM_AUDIO_SECONDS = 30
+
 
 class ShazamClient:
     """Client for identifying songs using Shazam API."""
 
     def __init__(self):
         """Initialize Shazam client."""
-        self._shazam = None
-
-    def _get_shazam(self):
-        """Lazy load shazamio to avoid import errors if not installed."""
-        if self._shazam is None:
-            try:
-                from shazamio import Shazam
-                self._shazam = Shazam()
-            except ImportError:
-                raise ImportError(
-                    "shazamio is required for song identification. "
-                    "Install it with: pip install shazamio"
-                )
-        return self._shazam
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use.
+
+        All identifications run on this one long-lived loop, so the Shazam
+        instance and its HTTP session are reused instead of being torn
+        down with a fresh loop per call.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="shazam-loop",
+                    daemon=True
+                ).start()
+        return self._loop
+
+    def close(self):
+        """Stop the background event loop, if it was started."""
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+                # Its HTTP session belongs to the stopped loop
+                self.__dict__.pop('_shazam', None)
+
+    @cached_property
+    def _shazam(self):
+        """Shazam instance, created on first use (on the loop thread)."""
+        try:
+            from shazamio import Shazam
+        except ImportError:
+            raise ImportError(
+                "shazamio is required for song identification. "
+                "Install it with: pip install shazamio"
+            )
+        return Shazam()
 
     async def _identify_async(self, audio_path: Path) -> Optional[Dict[str, Any]]:
         """Async method to identify song from audio file.
@@ -43,7 +83,7 @@ class ShazamClient:
             Dictionary with song info or None if not identified
         """
         try:
-            shazam = self._get_shazam()
+            shazam = self._shazam
             result = await shazam.recognize(str(audio_path))
 
             if not result or 'track' not in result:
@@ -78,65 +118,84 @@ class ShazamClient:
             return None
 
         try:
-            # Run async method in event loop (Windows compatible)
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop and loop.is_running():
-                # If already in async context, create new loop in thread
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, self._identify_async(audio_path))
-                    return future.result(timeout=60)
-            else:
-                # No running loop, safe to use asyncio.run
-                return asyncio.run(self._identify_async(audio_path))
+            # Works from sync code and from inside a running loop alike,
+            # since the coroutine runs on the client's own loop thread
+            future = asyncio.run_coroutine_threadsafe(
+                self._identify_async(audio_path), self._get_loop()
+            )
+            return future.result(timeout=IDENTIFY_TIMEOUT)
 
         except Exception as e:
             logger.error(f"Error in song identification: {e}")
             return None
 
-    def identify_from_video(self, video_path: Path, temp_dir: Path) -> Optional[Dict[str, Any]]:
-        """Extract audio from video and identify song.
+    def identify_samples(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        temp_dir: Path,
+        duration: float = SHAZAM_AUDIO_SECONDS
+    ) -> Optional[Dict[str, Any]]:
+        """Identify song from already decoded audio samples.
+
+        Lets rules reuse the audio decoded for other checks instead of
+        running ffmpeg again.
 
         Args:
-            video_path: Path to video file
+            samples: Mono int16 samples from the start of the track
+            sample_rate: Sample rate in Hz
             temp_dir: Directory for temporary audio file
+            duration: Seconds of audio to send (enough for identification)
 
         Returns:
             Dictionary with song info or None
         """
-        import subprocess
-
         audio_path = temp_dir / "temp_audio_for_shazam.wav"
         temp_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Extract first 30 seconds of audio (enough for identification)
-            subprocess.run([
-                "ffmpeg", "-i", str(video_path),
-                "-vn",  # No video
-                "-acodec", "pcm_s16le",
-                "-ar", "44100",
-                "-ac", "1",
-                "-t", "30",  # First 30 seconds
-                "-y",
-                str(audio_path)
-            ], check=True, capture_output=True)
-
-            result = self.identify(audio_path)
-
-            # Cleanup
+            write_wav(audio_path, samples[:int(duration * sample_rate)], sample_rate)
+            return self.identify(audio_path)
+
+        except Exception as e:
+            logger.error(f"Error preparing audio for identification: {e}")
+            return None
+
+        finally:
             if audio_path.exists():
                 audio_path.unlink()
 
-            return result
+    def identify_from_video(self, video_path: Path, temp_dir: Path) -> Optional[Dict[str, Any]]:
+        """Extract audio from video and identify song.
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error extracting audio: {e.stderr.decode()}")
-            return None
-        except Exception as e:
-            logger.error(f"Error extracting audio for identification: {e}")
+        Args:
+            video_path: Path to video file
+            temp_dir: Directory for temporary audio file
+
+        Returns:
+            Dictionary with song info or None
+        """
+        # Decode only the part sent for identification
+        samples = load_audio(video_path, AUDIO_SAMPLE_RATE, duration=SHAZAM_AUDIO_SECONDS)
+        if samples is None or not len(samples):
             return None
+
+        return self.identify_samples(samples, AUDIO_SAMPLE_RATE, temp_dir)
+
+
+# Client shared within the process, so all rules use one event loop thread
+_default_client: Optional[ShazamClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_shazam_client() -> ShazamClient:
+    """Get the process-wide Shazam client.
+
+    Returns:
+        Shared ShazamClient
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = ShazamClient()
+        return _default_client
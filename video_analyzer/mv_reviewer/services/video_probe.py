@@ -0,0 +1,311 @@
+"""Video probing and frame extraction shared by all review rules."""
+
+import json
+import logging
+import subprocess
+from contextlib import contextmanager
+from fractions import Fraction
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, List, Sequence
+
+import numpy as np
+
+from ..models.review_result import ReviewContext
+
+logger = logging.getLogger(__name__)
+
+# Relative positions of the frames sampled for content review
+SAMPLE_POINTS = (0.1, 0.3, 0.5, 0.7, 0.9)
+
+# Content frames are sent to a vision LLM that downscales them anyway
+SAMPLE_FRAME_MAX_EDGE = 768
+SAMPLE_FRAME_JPEG_QUALITY = 85
+
+
+def probe_video(video_path: Path) -> Optional[Dict[str, Any]]:
+    """Read stream information of the first video stream with ffprobe.
+
+    Rotation metadata (phone recordings) is applied so width/height match
+    the orientation of frames decoded by ffmpeg.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Dictionary with 'width', 'height', 'duration' and 'fps', or None
+    """
+    try:
+        result = subprocess.run([
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries",
+            "stream=width,height,r_frame_rate:stream_tags=rotate:"
+            "stream_side_data=rotation:format=duration",
+            "-of", "json",
+            str(video_path)
+        ], check=True, stdin=subprocess.DEVNULL, capture_output=True)
+
+        info = json.loads(result.stdout)
+        streams = info.get('streams', [])
+        if not streams:
+            return None
+
+        stream = streams[0]
+        width = int(stream['width'])
+        height = int(stream['height'])
+
+        rotation = stream.get('tags', {}).get('rotate', 0)
+        for side_data in stream.get('side_data_list', []):
+            rotation = side_data.get('rotation', rotation)
+
+        if int(float(rotation)) % 180:
+            width, height = height, width
+
+        frame_rate = stream.get('r_frame_rate', '0/1')
+        fps = float(Fraction(frame_rate)) if not frame_rate.endswith('/0') else 0.0
+
+        return {
+            'width': width,
+            'height': height,
+            'duration': float(info.get('format', {}).get('duration', 0.0)),
+            'fps': fps,
+        }
+
+    except subprocess.CalledProcessError as e:
+        logger.error(f"FFprobe error: {e.stderr.decode()}")
+        return None
+    except OSError as e:
+        logger.error(f"Could not run ffprobe: {e}")
+        return None
+    except (KeyError, ValueError) as e:
+        logger.error(f"Unexpected ffprobe output: {e}")
+        return None
+
+
+def read_first_frame(
+    video_path: Path,
+    width: int,
+    height: int,
+    gray: bool = False
+) -> Optional[np.ndarray]:
+    """Decode a single frame with ffmpeg into a numpy array.
+
+    With ``gray`` set, ffmpeg hands over the full-range luma plane directly,
+    so no color conversion is needed downstream.
+
+    Args:
+        video_path: Path to video file
+        width: Frame width from probing
+        height: Frame height from probing
+        gray: Decode to 8-bit grayscale instead of BGR
+
+    Returns:
+        Frame as (height, width) or (height, width, 3) uint8 array, or None
+    """
+    channels = 1 if gray else 3
+
+    try:
+        result = subprocess.run([
+            "ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error",
+            "-i", str(video_path),
+            "-an", "-sn",
+            "-frames:v", "1",
+            "-f", "rawvideo",
+            "-pix_fmt", "gray" if gray else "bgr24",
+            "-"
+        ], check=True, stdin=subprocess.DEVNULL, capture_output=True)
+
+    except subprocess.CalledProcessError as e:
+        logger.error(f"FFmpeg error: {e.stderr.decode()}")
+        return None
+    except OSError as e:
+        logger.error(f"Could not run ffmpeg: {e}")
+        return None
+
+    frame_size = width * height * channels
+    if len(result.stdout) < frame_size:
+        return None
+
+    frame = np.frombuffer(result.stdout[:frame_size], dtype=np.uint8)
+    return frame.reshape(height, width) if gray else frame.reshape(height, width, 3)
+
+
+@contextmanager
+def opened_capture(video_path: Path) -> Iterator[Any]:
+    """Open a cv2.VideoCapture that is released on every exit path.
+
+    Args:
+        video_path: Path to video file
+
+    Yields:
+        The capture (check isOpened() before reading)
+    """
+    import cv2
+
+    cap = cv2.VideoCapture(str(video_path))
+    try:
+        yield cap
+    finally:
+        cap.release()
+
+
+def _probe_with_opencv(video_path: Path) -> Optional[Dict[str, Any]]:
+    """Fallback for probe_video when ffprobe is unavailable or fails.
+
+    Slower than ffprobe (OpenCV initializes the decoder) and ignores
+    rotation metadata.
+    """
+    import cv2
+
+    with opened_capture(video_path) as cap:
+        if not cap.isOpened():
+            return None
+
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+        return {
+            'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'duration': frame_count / fps if fps > 0 else 0.0,
+            'fps': fps,
+        }
+
+
+def _read_first_frame_with_opencv(video_path: Path) -> Optional[np.ndarray]:
+    """Fallback for read_first_frame when ffmpeg is unavailable or fails."""
+    import cv2
+
+    with opened_capture(video_path) as cap:
+        ret, frame = cap.read()
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if ret else None
+
+
+def ensure_probed(context: ReviewContext) -> bool:
+    """Probe the video once and cache its stream information on the context.
+
+    Safe to call from every rule; only the first call runs ffprobe.
+
+    Args:
+        context: Review context
+
+    Returns:
+        True if video information is available on the context
+    """
+    if context.probed:
+        return context.video_width > 0 and context.video_height > 0
+
+    context.probed = True
+
+    info = probe_video(context.video_path)
+    if info is None:
+        info = _probe_with_opencv(context.video_path)
+    if info is None:
+        logger.error(f"Could not probe video: {context.video_path}")
+        return False
+
+    context.video_width = info['width']
+    context.video_height = info['height']
+    context.video_duration = info['duration']
+    context.fps = info['fps']
+
+    return True
+
+
+def ensure_first_frame(context: ReviewContext) -> Optional[np.ndarray]:
+    """Decode the first frame (grayscale) on demand and cache it on the context.
+
+    Args:
+        context: Review context
+
+    Returns:
+        Grayscale frame or None
+    """
+    if context.first_frame is None and ensure_probed(context):
+        context.first_frame = read_first_frame(
+            context.video_path, context.video_width, context.video_height, gray=True
+        )
+        if context.first_frame is None:
+            context.first_frame = _read_first_frame_with_opencv(context.video_path)
+    return context.first_frame
+
+
+def extract_sample_frames(
+    video_path: Path,
+    output_dir: Path,
+    sample_points: Sequence[float] = SAMPLE_POINTS
+) -> List[Path]:
+    """Extract JPEG frames at relative positions of the video.
+
+    Frames are shrunk to SAMPLE_FRAME_MAX_EDGE and saved as optimized
+    JPEGs, which keeps disk writes and LLM upload payloads small.
+
+    A signature of the video (mtime, size and sample points) is stored
+    next to the frames; while it still matches, the previously written
+    frames are returned without opening the video.
+
+    Args:
+        video_path: Path to video file
+        output_dir: Directory for the JPEG files and signature
+        sample_points: Positions to sample, as fractions of the frame count
+
+    Returns:
+        Paths of the extracted frames (empty if the video can't be read)
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    signature_path = output_dir / "frames.sig"
+
+    stat = video_path.stat()
+    signature = (
+        f"{stat.st_mtime_ns}:{stat.st_size}:{','.join(map(str, sample_points))}:"
+        f"{SAMPLE_FRAME_MAX_EDGE}:{SAMPLE_FRAME_JPEG_QUALITY}"
+    )
+
+    try:
+        cached = signature_path.read_text(encoding='utf-8').splitlines()
+        if cached and cached[0] == signature:
+            frame_paths = [output_dir / name for name in cached[1:]]
+            if frame_paths and all(p.exists() for p in frame_paths):
+                return frame_paths
+    except OSError:
+        pass
+
+    import cv2
+
+    encode_params = [
+        cv2.IMWRITE_JPEG_QUALITY, SAMPLE_FRAME_JPEG_QUALITY,
+        cv2.IMWRITE_JPEG_OPTIMIZE, 1,
+    ]
+
+    frame_paths = []
+    with opened_capture(video_path) as cap:
+        if not cap.isOpened():
+            return []
+
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+        for i, point in enumerate(sample_points):
+            cap.set(cv2.CAP_PROP_POS_FRAMES, int(total_frames * point))
+
+            # grab() decodes without color conversion; retrieve() only
+            # converts frames that were actually decoded
+            if not cap.grab():
+                continue
+
+            ret, frame = cap.retrieve()
+            if ret:
+                height, width = frame.shape[:2]
+                scale = SAMPLE_FRAME_MAX_EDGE / max(height, width)
+                if scale < 1.0:
+                    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+                    frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+                frame_path = output_dir / f"content_frame_{i}.jpg"
+                cv2.imwrite(str(frame_path), frame, encode_params)
+                frame_paths.append(frame_path)
+
+    if frame_paths:
+        signature_path.write_text(
+            '\n'.join([signature] + [p.name for p in frame_paths]), encoding='utf-8'
+        )
+
+    return frame_paths